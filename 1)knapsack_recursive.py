@@ -1,14 +1,294 @@
-def knapsack_recursive(wt,val,W,n):
-    if n==0 or W==0:
-        return 0
-    else:
-        if wt[n-1]<=W:
-            return max(val[n-1]+knapsack_recursive(wt,val,W-wt[n-1],n-1),knapsack_recursive(wt,val,W,n-1))
-        elif wt[n-1]>W:
-            return knapsack_recursive(wt,val,W,n-1)
-W = 6
-wt = [1,2,3,6]
-val = [1,2,4,6]
-n=4
-knapsack_recursive(wt,val,W,n)
-            
+from bisect import bisect_right
+from fractions import Fraction
+from numbers import Integral
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def knapsack_recursive(wt,val,W,n):
+    if n==0 or W==0:
+        return 0
+    else:
+        if wt[n-1]<=W:
+            return max(val[n-1]+knapsack_recursive(wt,val,W-wt[n-1],n-1),knapsack_recursive(wt,val,W,n-1))
+        elif wt[n-1]>W:
+            return knapsack_recursive(wt,val,W,n-1)
+
+
+def _row_dtype(values):
+    # NumPy dtype that holds every DP entry exactly: int64 for ints whose
+    # total fits, float64 for floats, None (use Python numbers) otherwise
+    if np is None:
+        return None
+    if all(isinstance(v, Integral) for v in values):
+        if sum(int(v) for v in values if v > 0) < 1 << 63:
+            return np.int64
+        return None
+    if all(isinstance(v, (Integral, float, np.floating)) for v in values):
+        return np.float64
+    return None
+
+
+def best_values(items, W):
+    # One-row 0/1 knapsack DP over (weight, value) pairs: entry c is the best
+    # value with total weight <= c. O(n*W) time, O(W) memory. The row is a
+    # NumPy array when the values fit a NumPy dtype exactly, else a list
+    items = list(items)
+    dtype = _row_dtype([v for _, v in items])
+    if dtype is not None:
+        dp = np.zeros(W + 1, dtype=dtype)
+        for w, v in items:
+            if w <= W:
+                # the right-hand side is built from the old row first, so
+                # every item is used at most once
+                dp[w:] = np.maximum(dp[w:], dp[:W + 1 - w] + v)
+        return dp
+    dp = [0] * (W + 1)
+    for w, v in items:
+        for c in range(W, w - 1, -1):
+            if dp[c - w] + v > dp[c]:
+                dp[c] = dp[c - w] + v
+    return dp
+
+
+def knapsack_value(wt, val, W):
+    row = best_values(zip(wt, val), W)
+    return row[W] if isinstance(row, list) else row[W].item()
+
+
+def _choose(items, W, chosen):
+    # Hirschberg-style reconstruction: split the items in half, find how
+    # the capacity is shared between the halves from one forward row each,
+    # then solve the halves independently. Only O(W) memory is live per level
+    items = [item for item in items if item[1] <= W]
+    if not items:
+        return
+    if len(items) == 1:
+        index, w, v = items[0]
+        if v > 0:
+            chosen.append(index)
+        return
+    mid = len(items) // 2
+    first = best_values([(w, v) for _, w, v in items[:mid]], W)
+    second = best_values([(w, v) for _, w, v in items[mid:]], W)
+    # the halves pick their own row type; the sums below need one that holds
+    # the total of both
+    if _row_dtype([v for _, _, v in items]) is None:
+        if not isinstance(first, list):
+            first = first.tolist()
+        if not isinstance(second, list):
+            second = second.tolist()
+        sums = [first[c] + second[W - c] for c in range(W + 1)]
+        split = max(range(W + 1), key=sums.__getitem__)
+    else:
+        split = int(np.argmax(first + second[::-1]))
+    del first, second
+    _choose(items[:mid], split, chosen)
+    _choose(items[mid:], W - split, chosen)
+
+
+def knapsack_01(wt, val, W):
+    # Best value and the indices of the chosen items
+    chosen = []
+    _choose([(i, w, v) for i, (w, v) in enumerate(zip(wt, val))], W, chosen)
+    chosen.sort()
+    return sum(val[i] for i in chosen), chosen
+
+
+def _split_counts(counts):
+    # Binary splitting: c copies of an item become bundles of 1, 2, 4, ...
+    # copies (plus a remainder), so any count 0..c is a subset of bundles
+    bundles = []
+    for i, c in enumerate(counts):
+        size = 1
+        while c > 0:
+            take = min(size, c)
+            bundles.append((i, take))
+            c -= take
+            size *= 2
+    return bundles
+
+
+def knapsack_bounded(wt, val, counts, W):
+    # Item i may be used up to counts[i] times; returns (best, {i: copies})
+    bundles = _split_counts(counts)
+    best, chosen = knapsack_01([wt[i] * k for i, k in bundles],
+                               [val[i] * k for i, k in bundles], W)
+    taken = {}
+    for b in chosen:
+        i, k = bundles[b]
+        taken[i] = taken.get(i, 0) + k
+    return best, taken
+
+
+def knapsack_unbounded(wt, val, W):
+    # Any number of copies of each item; returns (best, {i: copies}).
+    # One ascending O(n*W) pass: dp[c - w] may already include item i,
+    # which is what allows repeats. last[c] is the item that last improved
+    # dp[c], so the choice is rebuilt by walking back from W.
+    # A weightless item with positive value is counted once
+    dp = [0] * (W + 1)
+    last = [None] * (W + 1)
+    for i, (w, v) in enumerate(zip(wt, val)):
+        if w == 0:
+            continue
+        for c in range(w, W + 1):
+            if dp[c - w] + v > dp[c]:
+                dp[c] = dp[c - w] + v
+                last[c] = i
+    free = [i for i in range(len(wt)) if wt[i] == 0 and val[i] > 0]
+    taken = dict.fromkeys(free, 1)
+    c = W
+    while last[c] is not None:
+        i = last[c]
+        taken[i] = taken.get(i, 0) + 1
+        c -= wt[i]
+    return dp[W] + sum(val[i] for i in free), dict(sorted(taken.items()))
+
+
+def knapsack_branch_and_bound(wt, val, W, max_nodes=None):
+    # Depth-first branch and bound with items sorted by value density; a
+    # branch is cut when the fractional-knapsack bound of its remaining
+    # items cannot beat the best solution found so far. The work does not
+    # depend on W, so huge capacities are fine, but it is exponential in
+    # the worst case: with max_nodes set, None is returned once that many
+    # nodes have been expanded
+    # weightless items are always taken; the rest are sorted by density,
+    # exactly for integer values, so the greedy bound below is a true upper
+    # bound. The bound's fractional part is floored only when every value
+    # is an int, since only then is the optimum an int too
+    free = [i for i in range(len(wt)) if wt[i] == 0 and val[i] > 0]
+    integral = all(isinstance(v, Integral) for v in val)
+
+    def density(i):
+        return Fraction(val[i], wt[i]) if integral else val[i] / wt[i]
+
+    order = sorted((i for i in range(len(wt)) if 0 < wt[i] <= W and val[i] > 0),
+                   key=density, reverse=True)
+    ws = [wt[i] for i in order]
+    vs = [val[i] for i in order]
+    n = len(order)
+    # prefix sums give the greedy fill from item k in O(log n)
+    prefix_w, prefix_v = [0], [0]
+    for w, v in zip(ws, vs):
+        prefix_w.append(prefix_w[-1] + w)
+        prefix_v.append(prefix_v[-1] + v)
+
+    def bound(k, cap):
+        j = bisect_right(prefix_w, prefix_w[k] + cap) - 1
+        value = prefix_v[j] - prefix_v[k]
+        if j < n:
+            rest = cap - (prefix_w[j] - prefix_w[k])
+            if integral:
+                # integer floor of the fractional part keeps the bound exact
+                value += rest * vs[j] // ws[j]
+            else:
+                value += rest * vs[j] / ws[j]
+        return value
+
+    best, best_taken = 0, None
+    # taken is a linked list (item, rest) so that branches share it
+    stack = [(0, W, 0, None)]
+    nodes = 0
+    while stack:
+        k, cap, value, taken = stack.pop()
+        if value > best:
+            best, best_taken = value, taken
+        if k == n or value + bound(k, cap) <= best:
+            continue
+        nodes += 1
+        if max_nodes is not None and nodes > max_nodes:
+            return None
+        stack.append((k + 1, cap, value, taken))
+        if ws[k] <= cap:
+            stack.append((k + 1, cap - ws[k], value + vs[k], (k, taken)))
+
+    chosen = free[:]
+    while best_taken is not None:
+        k, best_taken = best_taken
+        chosen.append(order[k])
+    chosen.sort()
+    return best + sum(val[i] for i in free), chosen
+
+
+def _subsets(items):
+    # (weight, value, bitmask) of every subset of at most ~20 items
+    subsets = [(0, 0, 0)]
+    for bit, (w, v) in enumerate(items):
+        subsets += [(sw + w, sv + v, mask | 1 << bit) for sw, sv, mask in subsets]
+    return subsets
+
+
+# Most items knapsack_meet_in_the_middle() accepts: 2^20 subsets per half
+MITM_LIMIT = 40
+
+
+def knapsack_meet_in_the_middle(wt, val, W):
+    # Exact solver for n <= MITM_LIMIT items: enumerate the 2^(n/2) subsets
+    # of each half, keep the Pareto front (weight up, value up) of the second
+    # half and binary-search the best partner of every first-half subset
+    if len(wt) > MITM_LIMIT:
+        raise ValueError(f"meet in the middle is only practical for n <= {MITM_LIMIT}")
+    mid = len(wt) // 2
+    left = _subsets(list(zip(wt[:mid], val[:mid])))
+    right = sorted(_subsets(list(zip(wt[mid:], val[mid:]))))
+    front_w, front = [], []
+    for w, v, mask in right:
+        if w > W:
+            break
+        if not front or v > front[-1][0]:
+            front_w.append(w)
+            front.append((v, mask))
+
+    best, best_masks = 0, (0, 0)
+    for w, v, mask in left:
+        if w > W:
+            continue
+        j = bisect_right(front_w, W - w) - 1
+        if v + front[j][0] > best:
+            best, best_masks = v + front[j][0], (mask, front[j][1])
+    chosen = [i for i in range(mid) if best_masks[0] >> i & 1]
+    chosen += [mid + i for i in range(len(wt) - mid) if best_masks[1] >> i & 1]
+    return best, chosen
+
+
+# Largest n * W handled by the capacity DP in knapsack() without first
+# trying anything else
+DP_LIMIT = 10 ** 8 if np is not None else 10 ** 7
+
+# Largest W whose O(W) DP rows knapsack() is willing to allocate
+DP_CAPACITY_LIMIT = 10 ** 7
+
+# Nodes branch and bound may expand in knapsack() before it falls back to
+# the capacity DP
+BB_NODE_LIMIT = 10 ** 6
+
+
+def knapsack(wt, val, W):
+    # Pick a 0/1 solver: capacity DP when n * W is small enough, meet in the
+    # middle for up to MITM_LIMIT items, otherwise branch and bound, which
+    # gives up after BB_NODE_LIMIT nodes in favour of the DP whenever the
+    # DP rows fit in memory.
+    # Returns (best value, chosen indices)
+    if len(wt) * W <= DP_LIMIT:
+        return knapsack_01(wt, val, W)
+    if len(wt) <= MITM_LIMIT:
+        return knapsack_meet_in_the_middle(wt, val, W)
+    if W > DP_CAPACITY_LIMIT:
+        return knapsack_branch_and_bound(wt, val, W)
+    result = knapsack_branch_and_bound(wt, val, W, BB_NODE_LIMIT)
+    if result is None:
+        return knapsack_01(wt, val, W)
+    return result
+
+
+if __name__ == "__main__":
+    W = 6
+    wt = [1,2,3,6]
+    val = [1,2,4,6]
+    n=4
+    print(knapsack_recursive(wt,val,W,n))
+    print(knapsack(wt, val, W))
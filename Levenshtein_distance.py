@@ -11,26 +11,247 @@
 # sitten —> sittin (substitution of i for e)
 # sittin —> sitting (insertion of g at the end)
 
+import multiprocessing
+from bisect import bisect_left, bisect_right
+
+
 def levenshtein_distance(word_1, chars_1, word_2, chars_2):
-    # base case if the strings are empty
-    if chars_1 == 0:
-        return chars_2
-    if chars_2 == 0:
-        return chars_1
-
-    # if last characters of the string match, the cost of
-    # operations is 0, i.e. no changes are made
-    if word_1[chars_1 - 1] == word_2[chars_2 - 1]:
-        cost = 0
-    else:
-        cost = 1
-
-    # calculating the numbers of operations recursively
-    deletion =  levenshtein_distance(word_1, chars_1 - 1, word_2, chars_2) + 1
-    insertion = levenshtein_distance(word_1, chars_1, word_2, chars_2 - 1) + 1
-    substitution = levenshtein_distance(word_1, chars_1 - 1, word_2, chars_2 - 1) + cost
-
-    return min(deletion, insertion, substitution)
+    # distance between the first chars_1 characters of word_1 and the
+    # first chars_2 characters of word_2
+    return dp_distance(word_1[:chars_1], word_2[:chars_2])
+
+
+def dp_distance(word_1, word_2):
+    # classic dynamic programming, keeping only the previous and current
+    # rows: O(n*m) time and O(min(n, m)) memory
+    if len(word_1) < len(word_2):
+        word_1, word_2 = word_2, word_1
+    previous = list(range(len(word_2) + 1))
+    for i, char_1 in enumerate(word_1, 1):
+        current = [i]
+        for j, char_2 in enumerate(word_2, 1):
+            # if the characters match, the cost of substitution is 0
+            cost = 0 if char_1 == char_2 else 1
+            current.append(min(previous[j] + 1,          # deletion
+                               current[j - 1] + 1,       # insertion
+                               previous[j - 1] + cost))  # substitution
+        previous = current
+    return previous[-1]
+
+
+def myers_distance(word_1, word_2):
+    # bit-parallel algorithm of Myers (in Hyyro's form for edit distance):
+    # one column of the DP matrix is kept as bit vectors of +1/-1 vertical
+    # differences, so each character of word_2 costs a few integer
+    # operations. Python integers have no width limit, so patterns longer
+    # than a machine word just use multi-word integers
+    if len(word_1) < len(word_2):
+        word_1, word_2 = word_2, word_1
+    m = len(word_2)
+    if m == 0:
+        return len(word_1)
+
+    # the shorter word is the pattern; peq[c] has bit i set where word_2[i] == c
+    peq = {}
+    for i, char in enumerate(word_2):
+        peq[char] = peq.get(char, 0) | (1 << i)
+
+    full = (1 << m) - 1
+    last = 1 << (m - 1)
+    pv, mv = full, 0
+    score = m
+    for char in word_1:
+        eq = peq.get(char, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | (~(xh | pv) & full)
+        mh = pv & xh
+        if ph & last:
+            score += 1
+        elif mh & last:
+            score -= 1
+        ph = ((ph << 1) | 1) & full
+        mh = (mh << 1) & full
+        pv = mh | (~(xv | ph) & full)
+        mv = ph & xv
+    return score
+
+
+def distance(word_1, word_2, max_k=None):
+    # edit distance; with max_k only the diagonal band |i - j| <= max_k is
+    # kept and the scan stops as soon as a whole row exceeds max_k, in
+    # which case max_k + 1 is returned. The band is stored offset-indexed
+    # (entry b of row i is column i - max_k + b), so the cost is O(n * max_k)
+    if max_k is None:
+        return myers_distance(word_1, word_2)
+    if len(word_1) < len(word_2):
+        word_1, word_2 = word_2, word_1
+    n, m = len(word_1), len(word_2)
+    if n - m > max_k:
+        return max_k + 1
+
+    too_far = max_k + 1
+    width = 2 * max_k + 1
+    # one extra slot on the right stands for the column just outside the
+    # band, which is always too far
+    previous = [too_far] * (width + 1)
+    for b in range(max_k, min(width, max_k + m + 1)):
+        previous[b] = b - max_k
+    for i in range(1, n + 1):
+        current = [too_far] * (width + 1)
+        char_1 = word_1[i - 1]
+        best = too_far
+        first = i - max_k
+        for b in range(max(0, -first), min(width, m - first + 1)):
+            j = first + b
+            if j == 0:
+                value = i
+            else:
+                cost = 0 if char_1 == word_2[j - 1] else 1
+                # row i-1 is shifted one column left: column j is at b + 1
+                value = min(previous[b + 1] + 1, previous[b] + cost)
+                if b and current[b - 1] + 1 < value:
+                    value = current[b - 1] + 1
+                if value > too_far:
+                    value = too_far
+            current[b] = value
+            if value < best:
+                best = value
+        if best > max_k:
+            return too_far
+        previous = current
+    return min(previous[m - n + max_k], too_far)
+
+
+def edit_matrix(word_1, word_2, insert_cost=1, delete_cost=1,
+                substitute_cost=1, transpose_cost=None):
+    # full DP matrix with weighted costs; with transpose_cost set, swapping
+    # two adjacent characters is one more edit (optimal string alignment,
+    # the usual Damerau variant)
+    n, m = len(word_1), len(word_2)
+    matrix = [[0] * (m + 1) for _ in range(n + 1)]
+    for i in range(1, n + 1):
+        matrix[i][0] = i * delete_cost
+    for j in range(1, m + 1):
+        matrix[0][j] = j * insert_cost
+    for i in range(1, n + 1):
+        row, above = matrix[i], matrix[i - 1]
+        for j in range(1, m + 1):
+            cost = 0 if word_1[i - 1] == word_2[j - 1] else substitute_cost
+            value = min(above[j] + delete_cost,
+                        row[j - 1] + insert_cost,
+                        above[j - 1] + cost)
+            if (transpose_cost is not None and i > 1 and j > 1
+                    and word_1[i - 1] == word_2[j - 2]
+                    and word_1[i - 2] == word_2[j - 1]):
+                value = min(value, matrix[i - 2][j - 2] + transpose_cost)
+            row[j] = value
+    return matrix
+
+
+def weighted_distance(word_1, word_2, insert_cost=1, delete_cost=1,
+                      substitute_cost=1, transpose_cost=None):
+    if transpose_cost is None and insert_cost == delete_cost == substitute_cost == 1:
+        return myers_distance(word_1, word_2)
+    return edit_matrix(word_1, word_2, insert_cost, delete_cost,
+                       substitute_cost, transpose_cost)[-1][-1]
+
+
+def alignment(word_1, word_2, insert_cost=1, delete_cost=1,
+              substitute_cost=1, transpose_cost=None):
+    # distance and the edit script that turns word_1 into word_2, as a list
+    # of (operation, position in word_1, position in word_2) with the
+    # operations "match", "substitute", "insert", "delete", "transpose"
+    matrix = edit_matrix(word_1, word_2, insert_cost, delete_cost,
+                         substitute_cost, transpose_cost)
+    i, j = len(word_1), len(word_2)
+    script = []
+    while i or j:
+        value = matrix[i][j]
+        if i and j and word_1[i - 1] == word_2[j - 1] and value == matrix[i - 1][j - 1]:
+            script.append(("match", i - 1, j - 1))
+            i, j = i - 1, j - 1
+        elif i and j and value == matrix[i - 1][j - 1] + substitute_cost:
+            script.append(("substitute", i - 1, j - 1))
+            i, j = i - 1, j - 1
+        elif i and value == matrix[i - 1][j] + delete_cost:
+            script.append(("delete", i - 1, j))
+            i -= 1
+        elif j and value == matrix[i][j - 1] + insert_cost:
+            script.append(("insert", i, j - 1))
+            j -= 1
+        else:
+            script.append(("transpose", i - 2, j - 2))
+            i, j = i - 2, j - 2
+    script.reverse()
+    return matrix[-1][-1], script
+
+
+# state shared with pool workers, set once per process by _init_worker
+_BATCH = None
+
+
+def _init_worker(batch):
+    global _BATCH
+    _BATCH = batch
+
+
+def _compare_rows(rows):
+    # all surviving pairs for a slice of the first list
+    words_1, words_2, order, lengths, max_k, costs, with_alignment = _BATCH
+    insert_cost, delete_cost = costs["insert_cost"], costs["delete_cost"]
+    unit = (costs["transpose_cost"] is None
+            and insert_cost == delete_cost == costs["substitute_cost"] == 1)
+    results = []
+    for i in range(*rows):
+        word_1 = words_1[i]
+        low, high = 0, len(order)
+        step = min(insert_cost, delete_cost)
+        if max_k is not None and step > 0:
+            # length filter: every extra or missing character costs at least
+            # one insertion or deletion
+            slack = max_k // step
+            low = bisect_left(lengths, len(word_1) - slack)
+            high = bisect_right(lengths, len(word_1) + slack)
+        for k in range(low, high):
+            j = order[k]
+            word_2 = words_2[j]
+            if with_alignment:
+                result = alignment(word_1, word_2, **costs)
+                d = result[0]
+            elif unit:
+                d = result = distance(word_1, word_2, max_k)
+            else:
+                d = result = weighted_distance(word_1, word_2, **costs)
+            if max_k is None or d <= max_k:
+                results.append((i, j, result))
+    return results
+
+
+def batch_distances(words_1, words_2, max_k=None, processes=None,
+                    with_alignment=False, insert_cost=1, delete_cost=1,
+                    substitute_cost=1, transpose_cost=None, rows_per_task=256):
+    # many-vs-many edit distance: {(i, j): distance} for every pair with
+    # distance <= max_k (all pairs when max_k is None), or
+    # {(i, j): (distance, edit script)} with with_alignment. Pairs whose
+    # lengths already differ too much are skipped, and the rest are spread
+    # over a process pool (processes=1 runs in this process)
+    order = sorted(range(len(words_2)), key=lambda j: len(words_2[j]))
+    lengths = [len(words_2[j]) for j in order]
+    costs = {"insert_cost": insert_cost, "delete_cost": delete_cost,
+             "substitute_cost": substitute_cost, "transpose_cost": transpose_cost}
+    batch = (list(words_1), list(words_2), order, lengths, max_k, costs, with_alignment)
+    tasks = [(start, min(start + rows_per_task, len(words_1)))
+             for start in range(0, len(words_1), rows_per_task)]
+
+    if processes == 1:
+        _init_worker(batch)
+        chunks = map(_compare_rows, tasks)
+        return {(i, j): result for chunk in chunks for i, j, result in chunk}
+    with multiprocessing.Pool(processes, _init_worker, (batch,)) as pool:
+        chunks = pool.map(_compare_rows, tasks)
+    return {(i, j): result for chunk in chunks for i, j, result in chunk}
+
 
 # driving script
 if __name__ == '__main__':
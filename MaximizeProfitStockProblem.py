@@ -1,32 +1,204 @@
 # Module to return the maximum profit that can be made after buying and selling the given stocks
 
+import heapq
+
+try:
+	import numpy as np
+except ImportError:
+	np = None
+
+
 def maxProfit(price, start, end):
 
-	# If the stocks can't be bought
+	# Any number of non-overlapping transactions between day start and day end
 	if (end <= start):
 		return 0
+	return max_profit_unlimited(price[start:end + 1])
+
+
+def max_profit_unlimited(prices):
+
+	# With unlimited transactions every rise from one day to the next is
+	# collected, so the answer is the sum of the positive differences: O(n)
+	if np is not None and len(prices) > 1:
+		values = np.asarray(prices)
+		# NumPy turns a list mixing ints past 2**63 with small ones into
+		# float64, so only an inferred int64 or an array the caller built
+		# is summed in place; the total must also stay inside int64
+		if values.dtype.kind == "i":
+			span = int(values.max()) - int(values.min())
+			vectorise = (len(values) - 1) * span < 1 << 63
+		else:
+			vectorise = values.dtype.kind == "f" and isinstance(prices, np.ndarray)
+		if vectorise:
+			diff = np.diff(values)
+			return diff[diff > 0].sum().item()
+		if isinstance(prices, np.ndarray):
+			prices = prices.tolist()
+	return sum(max(b - a, 0) for a, b in zip(prices, prices[1:]))
+
+
+def unlimited_trades(prices):
+
+	# The trades behind max_profit_unlimited: buy at every local valley and
+	# sell at the following peak, as (buy day, sell day) pairs
+	trades = []
+	n = len(prices)
+	i = 0
+	while i < n - 1:
+		while i < n - 1 and prices[i + 1] <= prices[i]:
+			i += 1
+		buy = i
+		while i < n - 1 and prices[i + 1] >= prices[i]:
+			i += 1
+		if prices[i] > prices[buy]:
+			trades.append((buy, i))
+	return trades
+
+
+def max_profit_k_dp(prices, k):
+
+	# At most k transactions, O(n*k) DP over "best cash after the j-th sell"
+	# and "best cash while holding the j-th buy"
+	if k == 0 or len(prices) < 2:
+		return 0
+	buy = [float("-inf")] * (k + 1)
+	sell = [0] * (k + 1)
+	for p in prices:
+		for j in range(1, k + 1):
+			buy[j] = max(buy[j], sell[j - 1] - p)
+			sell[j] = max(sell[j], buy[j] + p)
+	return sell[k]
+
+
+def max_profit_k(prices, k):
+
+	# At most k transactions in O(n log n) for any k: split the series into
+	# valley/peak runs, merge or split overlapping runs with a stack so every
+	# candidate profit is independent, then take the k largest
+	n = len(prices)
+	if k == 0 or n < 2:
+		return 0
+	if 2 * k >= n:
+		return max_profit_unlimited(prices)
+
+	stack = []
+	profits = []
+	v = 0
+	while v < n - 1:
+		while v < n - 1 and prices[v] >= prices[v + 1]:
+			v += 1
+		p = v + 1
+		while p < n and prices[p] >= prices[p - 1]:
+			p += 1
+		# Runs whose valley is higher than this valley can no longer merge
+		while stack and prices[v] < prices[stack[-1][0]]:
+			vi, pi = stack.pop()
+			profits.append(prices[pi - 1] - prices[vi])
+		# A higher peak merges with an earlier lower valley; the difference
+		# stays available as a separate profit
+		while stack and prices[p - 1] >= prices[stack[-1][1] - 1]:
+			vi, pi = stack.pop()
+			profits.append(prices[pi - 1] - prices[v])
+			v = vi
+		stack.append((v, p))
+		v = p
+	while stack:
+		vi, pi = stack.pop()
+		profits.append(prices[pi - 1] - prices[vi])
+	return sum(x for x in heapq.nlargest(k, profits) if x > 0)
+
+
+def max_profit_k_trades(prices, k):
+
+	# The trades behind max_profit_k, as (profit, [(buy day, sell day), ...]).
+	# Same DP as max_profit_k_dp with the improvements of each day recorded
+	# in two n*(k+1) bytearrays and walked back afterwards, so O(n*k) time
+	n = len(prices)
+	if k == 0 or n < 2:
+		return 0, []
+	if 2 * k >= n:
+		trades = unlimited_trades(prices)
+		return trades_profit(prices, trades), trades
+	width = k + 1
+	bought = bytearray(n * width)
+	sold = bytearray(n * width)
+	buy = [float("-inf")] * width
+	sell = [0] * width
+	for i, p in enumerate(prices):
+		# j descending so both updates read yesterday's values
+		for j in range(k, 0, -1):
+			if buy[j] + p > sell[j]:
+				sell[j] = buy[j] + p
+				sold[i * width + j] = 1
+			if sell[j - 1] - p > buy[j]:
+				buy[j] = sell[j - 1] - p
+				bought[i * width + j] = 1
+
+	trades = []
+	holding = False
+	j = k
+	sell_day = None
+	for i in range(n - 1, -1, -1):
+		if j == 0:
+			break
+		if not holding and sold[i * width + j]:
+			holding, sell_day = True, i
+		elif holding and bought[i * width + j]:
+			trades.append((i, sell_day))
+			holding = False
+			j -= 1
+	trades.reverse()
+	return sell[k], trades
 
-	# Initialise the profit
-	profit = 0
 
-	# The day at which the stock must be bought
-	for i in range(start, end, 1):
+def max_profit_with_rules(prices, fee=0, cooldown=0):
 
-		# The day at which the stock must be sold
-		for j in range(i+1, end+1):
+	# Unlimited transactions paying fee per sale and waiting cooldown days
+	# after a sale before buying again. Returns (profit, trades) where the
+	# trades are (buy day, sell day) pairs; the decisions of each day are
+	# kept in two bytearrays so the trades can be walked back afterwards
+	n = len(prices)
+	if n < 2:
+		return 0, []
+	bought = bytearray(n)
+	sold = bytearray(n)
+	# cash[-1 - c] is the best cash c days ago; all zero before day 0
+	recent_cash = [0] * (cooldown + 1)
+	hold = float("-inf")
+	for i, p in enumerate(prices):
+		cash = recent_cash[-1]
+		new_hold = hold
+		if recent_cash[0] - p > hold:
+			new_hold = recent_cash[0] - p
+			bought[i] = 1
+		if hold + p - fee > cash:
+			cash = hold + p - fee
+			sold[i] = 1
+		hold = new_hold
+		recent_cash = recent_cash[1:] + [cash]
 
-			# If buying the stock at ith day and selling it at jth day is profitable
-			if (price[j] > price[i]):
+	trades = []
+	holding = False
+	sell_day = None
+	i = n - 1
+	while i >= 0:
+		if not holding and sold[i]:
+			holding, sell_day = True, i
+			i -= 1
+		elif holding and bought[i]:
+			trades.append((i, sell_day))
+			holding = False
+			i -= 1 + cooldown
+		else:
+			i -= 1
+	trades.reverse()
+	return recent_cash[-1], trades
 
-				# Update the current profit
-				current_profit = price[j] - price[i] +\
-					maxProfit(price, start, i - 1) + \
-					maxProfit(price, j + 1, end)
 
-				# Update the maximum profit so far
-				profit = max(profit, current_profit)
+def trades_profit(prices, trades, fee=0):
 
-	return profit
+	return sum(prices[s] - prices[b] - fee for b, s in trades)
 
 # Example Driver Code
 if __name__ == '__main__':
@@ -1,13 +1,173 @@
-p = list(map(int, input().split()))   #Enter the prices of each day
-
-maxProfit = 0
-currentMax = 0
-
-for i in reversed(p):
-    currentMax = max(currentMax, i)
-    profit = currentMax - i
-    maxProfit = max(profit, maxProfit)
-    
-print("Buy stock when price is:", currentMax-maxProfit) #Buying Price
-print("Sell stock when price is:", currentMax)          #Selling Price
-print("Maximum profit earned:", maxProfit)              #Profit Earned
\ No newline at end of file
+# Best single buy/sell over a live price feed, in one forward pass
+
+from array import array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class BestTradeTracker:
+    # O(1) state: the cheapest price so far and the best trade so far.
+    # Ticks are numbered from 0 in the order they arrive
+
+    def __init__(self):
+        self.count = 0
+        self.min_price = None
+        self.min_tick = None
+        self.best_profit = 0
+        self.buy_tick = self.sell_tick = None
+        self.buy_price = self.sell_price = None
+
+    def update(self, price):
+        tick = self.count
+        self.count += 1
+        if self.min_price is None or price < self.min_price:
+            self.min_price, self.min_tick = price, tick
+        elif price - self.min_price > self.best_profit:
+            self.best_profit = price - self.min_price
+            self.buy_tick, self.sell_tick = self.min_tick, tick
+            self.buy_price, self.sell_price = self.min_price, price
+
+    def feed(self, prices):
+        for price in prices:
+            self.update(price)
+        return self
+
+    def feed_block(self, block):
+        # Same as feed() for a whole array at once: with NumPy the running
+        # minimum and the best sale are found with vectorised scans
+        if np is None:
+            return self.feed(block)
+        block = np.asarray(block)
+        if block.size == 0:
+            return self
+        start = self.count
+        running_min = np.minimum.accumulate(block)
+        min_tick = start + _accumulated_argmin(block)
+        if self.min_price is not None:
+            before = running_min >= self.min_price
+            min_tick = np.where(before, self.min_tick, min_tick)
+            running_min = np.minimum(running_min, self.min_price)
+        # Best sale at each tick uses the cheapest price before it
+        previous_min = np.concatenate((
+            [self.min_price if self.min_price is not None else block[0]],
+            running_min[:-1]))
+        profits = block - previous_min
+        best = int(np.argmax(profits))
+        if profits[best] > self.best_profit:
+            self.best_profit = profits[best].item()
+            self.buy_tick = int(min_tick[best - 1]) if best else self.min_tick
+            self.sell_tick = start + best
+            self.buy_price = previous_min[best].item()
+            self.sell_price = block[best].item()
+        self.min_price = running_min[-1].item()
+        self.min_tick = int(min_tick[-1])
+        self.count += block.size
+        return self
+
+
+def _accumulated_argmin(block):
+    # Index of the running minimum at every position (first occurrence)
+    is_new_min = np.concatenate(([True], block[1:] < np.minimum.accumulate(block)[:-1]))
+    positions = np.where(is_new_min, np.arange(block.size), 0)
+    return np.maximum.accumulate(positions)
+
+
+def _combine(a, b):
+    # Summary of two consecutive stretches of ticks, a before b:
+    # (min, min tick, max, max tick, best profit, buy tick, sell tick)
+    best = max((a[4], a[5], a[6]), (b[4], b[5], b[6]),
+               (b[2] - a[0], a[1], b[3]), key=lambda t: t[0])
+    low = a[:2] if a[0] <= b[0] else b[:2]
+    high = b[2:4] if b[2] >= a[2] else a[2:4]
+    return low + high + best
+
+
+class SlidingWindowProfit:
+    # Best buy/sell inside the last `window` ticks. The window is a queue
+    # built from two stacks that carry running summaries, so every update
+    # is amortised O(1)
+
+    def __init__(self, window):
+        self.window = window
+        self.count = 0
+        self._front = []   # summaries of each tick and the newer ticks above it
+        self._back = []    # raw tick summaries
+        self._back_summary = None
+
+    def update(self, price):
+        tick = self.count
+        self.count += 1
+        summary = (price, tick, price, tick, 0, None, None)
+        self._back.append(summary)
+        self._back_summary = (summary if self._back_summary is None
+                              else _combine(self._back_summary, summary))
+        if len(self._front) + len(self._back) > self.window:
+            if not self._front:
+                running = None
+                while self._back:
+                    item = self._back.pop()
+                    running = item if running is None else _combine(item, running)
+                    self._front.append(running)
+                self._back_summary = None
+            self._front.pop()
+        return self.best()
+
+    def best(self):
+        # (profit, buy tick, sell tick) for the current window
+        parts = [s for s in (self._front[-1] if self._front else None,
+                             self._back_summary) if s is not None]
+        if not parts:
+            return 0, None, None
+        summary = parts[0] if len(parts) == 1 else _combine(*parts)
+        return summary[4], summary[5], summary[6]
+
+
+def prices_from_text(stream):
+    # Prices from a text stream, whitespace separated; for a socket pass
+    # sock.makefile("r")
+    for line in stream:
+        for token in line.split():
+            yield float(token)
+
+
+def blocks_from_binary(path, typecode="d", block_size=1 << 20):
+    # Raw machine-format prices (array typecode, e.g. "d" for float64)
+    # read in blocks
+    with open(path, "rb") as f:
+        while True:
+            if np is not None:
+                block = np.fromfile(f, dtype=typecode, count=block_size)
+                if block.size == 0:
+                    return
+            else:
+                block = array(typecode)
+                try:
+                    block.fromfile(f, block_size)
+                except EOFError:
+                    pass
+                if not block:
+                    return
+            yield block
+
+
+def track_binary_file(path, typecode="d"):
+    tracker = BestTradeTracker()
+    for block in blocks_from_binary(path, typecode):
+        tracker.feed_block(block)
+    return tracker
+
+
+if __name__ == "__main__":
+    p = list(map(int, input().split()))   #Enter the prices of each day
+
+    tracker = BestTradeTracker().feed(p)
+
+    if tracker.best_profit > 0:
+        print("Buy stock when price is:", tracker.buy_price)    #Buying Price
+        print("Sell stock when price is:", tracker.sell_price)  #Selling Price
+    else:
+        print("No profitable trade")
+    print("Maximum profit earned:", tracker.best_profit)        #Profit Earned
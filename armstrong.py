@@ -2,10 +2,12 @@ def power(x, y):
       
     if y == 0:
         return 1
+    # Compute the half power once, so there is one call per level: O(log y)
+    half = power(x, y // 2)
     if y % 2 == 0:
-        return power(x, y // 2) * power(x, y // 2)
+        return half * half
           
-    return x * power(x, y // 2) * power(x, y // 2)
+    return x * half * half
   
 def order(x):
   
@@ -4,6 +4,14 @@
 # The transformations are: divide by 2 if the number is even, multiply by 3 and add 1 if its odd.
 # You can see more about it here https://en.wikipedia.org/wiki/Collatz_conjecture
 
+import multiprocessing
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
 def collatz(initial_number):
     num = initial_number
     print(f'Initial number is: {initial_number}')
@@ -15,4 +23,166 @@ def collatz(initial_number):
             num = int(3 * num + 1)
     else:
         print(num)
-        print('Finally!')
\ No newline at end of file
+        print('Finally!')
+
+
+# Non-printing engine: stopping times (steps to reach 1) and peak values
+# for whole ranges. Results for n < cache limit are kept in a bounded array
+# cache, so a trajectory stops as soon as it drops to a known number.
+# Blocks of numbers are stepped together with NumPy when it is installed.
+
+BLOCK_SIZE = 1 << 16
+
+# Largest value whose 3n + 1 still fits in an int64 lane
+INT64_STEP_LIMIT = (2 ** 63 - 2) // 3
+
+
+def stopping_time(n):
+    # Steps to reach 1 and the largest value seen, for a single n
+    steps, peak = 0, n
+    while n != 1:
+        n = n // 2 if n % 2 == 0 else 3 * n + 1
+        peak = max(peak, n)
+        steps += 1
+    return steps, peak
+
+
+def _finish(cur, steps, peak, steps_cache, peaks_cache, known):
+    # Follow one trajectory with Python ints until it drops below known
+    while cur >= known:
+        cur = cur // 2 if cur % 2 == 0 else 3 * cur + 1
+        peak = max(peak, cur)
+        steps += 1
+    return steps + int(steps_cache[cur]), max(peak, int(peaks_cache[cur]))
+
+
+def _run_block(start, stop, steps_cache, peaks_cache, known):
+    # Stopping times and peaks for [start, stop); numbers below known are
+    # looked up in the cache
+    if np is None or stop > INT64_STEP_LIMIT:
+        out_steps, out_peaks = [], []
+        for n in range(start, stop):
+            steps, peak = _finish(n, 0, n, steps_cache, peaks_cache, known)
+            out_steps.append(steps)
+            out_peaks.append(peak)
+        return out_steps, out_peaks
+
+    size = stop - start
+    cur = np.arange(start, stop, dtype=np.int64)
+    peak = cur.copy()
+    steps = np.zeros(size, dtype=np.int64)
+    index = np.arange(size)
+    out_steps = np.empty(size, dtype=np.int64)
+    out_peaks = np.empty(size, dtype=np.int64)
+    while index.size:
+        hit = cur < known
+        if hit.any():
+            found = cur[hit]
+            out_steps[index[hit]] = steps[hit] + steps_cache[found]
+            out_peaks[index[hit]] = np.maximum(peak[hit], peaks_cache[found])
+            keep = ~hit
+            cur, peak, steps, index = cur[keep], peak[keep], steps[keep], index[keep]
+            if not index.size:
+                break
+        # Lanes whose next 3n + 1 would overflow int64 finish in Python ints;
+        # their peaks may not fit in int64 either
+        over = cur > INT64_STEP_LIMIT
+        if over.any():
+            out_peaks = out_peaks.astype(object)
+            for i, c, s, p in zip(index[over], cur[over], steps[over], peak[over]):
+                out_steps[i], out_peaks[i] = _finish(
+                    int(c), int(s), int(p), steps_cache, peaks_cache, known)
+            keep = ~over
+            cur, peak, steps, index = cur[keep], peak[keep], steps[keep], index[keep]
+            if not index.size:
+                break
+        cur = np.where(cur & 1, 3 * cur + 1, cur >> 1)
+        np.maximum(peak, cur, out=peak)
+        steps += 1
+    return out_steps, out_peaks
+
+
+def build_cache(limit, block_size=BLOCK_SIZE):
+    # Stopping times and peaks of every n < limit, filled block by block so
+    # each block can use everything below it
+    limit = max(limit, 2)
+    if np is not None:
+        steps_cache = np.zeros(limit, dtype=np.int64)
+        peaks_cache = np.zeros(limit, dtype=np.int64)
+    else:
+        steps_cache = [0] * limit
+        peaks_cache = [0] * limit
+    peaks_cache[1] = 1
+    for start in range(2, limit, block_size):
+        stop = min(start + block_size, limit)
+        steps, peaks = _run_block(start, stop, steps_cache, peaks_cache, start)
+        steps_cache[start:stop] = steps
+        peaks_cache[start:stop] = peaks
+    return steps_cache, peaks_cache
+
+
+def collatz_range(a, b, cache, block_size=BLOCK_SIZE):
+    # Yield (n, stopping time, peak) for every n in [a, b)
+    steps_cache, peaks_cache = cache
+    known = len(steps_cache)
+    for start in range(max(a, 1), b, block_size):
+        stop = min(start + block_size, b)
+        steps, peaks = _run_block(start, stop, steps_cache, peaks_cache, known)
+        for n, s, p in zip(range(start, stop), steps, peaks):
+            yield n, int(s), int(p)
+
+
+_CACHE = None
+
+
+def _init_worker(cache):
+    global _CACHE
+    _CACHE = cache
+
+
+def _argmax(values):
+    # Index of the first largest value
+    if np is not None:
+        return int(np.argmax(values))
+    return max(range(len(values)), key=values.__getitem__)
+
+
+def _longest_in(shard):
+    # Works on whole blocks from _run_block; argmax keeps the first, i.e.
+    # smallest, n on ties
+    best_steps = best_peak = (0, 0)
+    start, stop = shard
+    steps_cache, peaks_cache = _CACHE
+    known = len(steps_cache)
+    for lo in range(max(start, 1), stop, BLOCK_SIZE):
+        hi = min(lo + BLOCK_SIZE, stop)
+        steps, peaks = _run_block(lo, hi, steps_cache, peaks_cache, known)
+        i, j = _argmax(steps), _argmax(peaks)
+        if steps[i] > best_steps[1]:
+            best_steps = (lo + i, int(steps[i]))
+        if peaks[j] > best_peak[1]:
+            best_peak = (lo + j, int(peaks[j]))
+    return best_steps, best_peak
+
+
+def longest_trajectory(limit, processes=None, cache_limit=10 ** 7,
+                       shard_size=1 << 20):
+    # Longest trajectory and highest peak for 1 <= n < limit, sharded over
+    # a process pool. The cache is built once here and handed to the
+    # workers (shared copy-on-write where processes are forked).
+    # Returns ((n, stopping time), (n, peak))
+    cache = build_cache(min(cache_limit, limit))
+    shards = [(lo, min(lo + shard_size, limit)) for lo in range(1, limit, shard_size)]
+    with multiprocessing.Pool(processes, _init_worker, (cache,)) as pool:
+        results = pool.map(_longest_in, shards)
+    best_steps = max((r[0] for r in results), key=lambda r: (r[1], -r[0]))
+    best_peak = max((r[1] for r in results), key=lambda r: (r[1], -r[0]))
+    return best_steps, best_peak
+
+
+if __name__ == "__main__":
+    collatz(int(input("Enter a number: ")))
+    limit = int(input("Find the longest trajectory below: "))
+    (n, steps), (m, peak) = longest_trajectory(limit)
+    print(f"{n} takes the most steps to reach 1: {steps}")
+    print(f"{m} climbs the highest: {peak}")
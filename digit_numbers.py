@@ -0,0 +1,249 @@
+"""
+Digit-property numbers - enumerate Armstrong, disarium, strong, spy and
+automorphic numbers in a range [a, b) instead of testing every number
+
+Armstrong, strong and spy numbers only depend on the multiset of their
+digits, so the search walks sorted digit multisets (with pruning) rather
+than numbers. Disarium numbers are found by meet-in-the-middle on the high
+and low halves of the digits, with the digit-power sums of each half
+computed over NumPy blocks when NumPy is installed. Automorphic numbers
+are the solutions of n*n = n (mod 10**k), built directly with the CRT.
+Searching all of them up to 10**12 takes seconds.
+"""
+
+from math import factorial
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+FACTORIALS = [factorial(d) for d in range(10)]
+
+
+def digit_powers(exponent):
+    """Table of d**exponent for every digit d"""
+    return [d ** exponent for d in range(10)]
+
+
+def _digits(n):
+    return [int(c) for c in str(n)]
+
+
+def is_armstrong(n):
+    table = digit_powers(len(str(n)))
+    return n >= 0 and sum(table[d] for d in _digits(n)) == n
+
+
+def is_disarium(n):
+    return n >= 0 and sum(d ** i for i, d in enumerate(_digits(n), 1)) == n
+
+
+def is_strong(n):
+    return n > 0 and sum(FACTORIALS[d] for d in _digits(n)) == n
+
+
+def is_spy(n):
+    digits = _digits(n)
+    product = 1
+    for d in digits:
+        product *= d
+    return n > 0 and sum(digits) == product
+
+
+def is_automorphic(n):
+    return n >= 0 and (n * n) % 10 ** len(str(n)) == n
+
+
+def _lengths(a, b):
+    """Digit counts of the numbers in [max(a, 1), b)"""
+    if b <= max(a, 1):
+        return range(0)
+    return range(len(str(max(a, 1))), len(str(b - 1)) + 1)
+
+
+def _multisets(length, digits, score, accept):
+    """
+    Walk sorted digit multisets of the given length
+
+    score(total, d) adds digit d to the running total; accept(total,
+    remaining, top) returns False to prune the subtree.
+    Yields (multiset, total) pairs.
+    """
+    chosen = []
+
+    def walk(start, remaining, total):
+        if not accept(total, remaining, digits[-1]):
+            return
+        if remaining == 0:
+            yield tuple(chosen), total
+            return
+        for i in range(start, len(digits)):
+            d = digits[i]
+            chosen.append(d)
+            yield from walk(i, remaining - 1, score(total, d))
+            chosen.pop()
+
+    yield from walk(0, length, None)
+
+
+def _self_describing(length, table, a, b):
+    """Numbers of this length equal to the table sum of their own digits"""
+    low, high = 10 ** (length - 1), 10 ** length
+    if length == 1:
+        low = 0
+    top = max(table)
+
+    def accept(total, remaining, _):
+        total = total or 0
+        # Prune when the sum is already too big or can no longer get big enough
+        return total < high and total + remaining * top >= low
+
+    found = []
+    for multiset, total in _multisets(length, range(10),
+                                      lambda t, d: (t or 0) + table[d], accept):
+        if low <= total < high and tuple(sorted(_digits(total))) == multiset:
+            if a <= total < b:
+                found.append(total)
+    return found
+
+
+def armstrong_numbers(a, b):
+    """Armstrong (narcissistic) numbers in [a, b)"""
+    found = [0] if a <= 0 < b else []
+    for length in _lengths(a, b):
+        found += [n for n in _self_describing(length, digit_powers(length), a, b)
+                  if n > 0]
+    return sorted(found)
+
+
+def strong_numbers(a, b):
+    """Strong numbers (sum of digit factorials) in [a, b)"""
+    found = []
+    for length in _lengths(a, b):
+        # length * 9! has fewer than length digits from 8 digits on
+        if length * FACTORIALS[9] < 10 ** (length - 1):
+            break
+        found += [n for n in _self_describing(length, FACTORIALS, a, b) if n > 0]
+    return sorted(found)
+
+
+def _multiset_permutations(multiset):
+    """Distinct permutations of a sorted digit tuple, in increasing order"""
+    items = list(multiset)
+    n = len(items)
+    while True:
+        yield items
+        # Standard next-permutation step
+        i = n - 2
+        while i >= 0 and items[i] >= items[i + 1]:
+            i -= 1
+        if i < 0:
+            return
+        j = n - 1
+        while items[j] <= items[i]:
+            j -= 1
+        items[i], items[j] = items[j], items[i]
+        items[i + 1:] = reversed(items[i + 1:])
+
+
+def spy_numbers(a, b):
+    """Spy numbers (digit sum equals digit product) in [a, b)"""
+    found = []
+    for length in _lengths(a, b):
+        # A zero digit makes the product 0, so only digits 1..9 are used;
+        # the product can never exceed the largest possible sum 9 * length
+        limit = 9 * length
+
+        def accept(state, remaining, _):
+            return state is None or state[1] <= limit
+
+        def score(state, d):
+            total, product = state or (0, 1)
+            return total + d, product * d
+
+        for multiset, (total, product) in _multisets(length, range(1, 10),
+                                                     score, accept):
+            if total != product:
+                continue
+            for digits in _multiset_permutations(multiset):
+                n = int("".join(map(str, digits)))
+                if a <= n < b:
+                    found.append(n)
+    return sorted(found)
+
+
+def _power_sums(count, width, first_exponent):
+    """
+    For x in [0, count), the sum of digit_i ** (first_exponent + i) over the
+    width digits of x (zero-padded, most significant first)
+    """
+    if np is not None:
+        x = np.arange(count, dtype=np.int64)
+        largest = width * 9 ** (first_exponent + width - 1)
+        sums = np.zeros(count, dtype=np.int64 if largest < 2 ** 63 else object)
+        for i in range(width - 1, -1, -1):
+            x, digit = np.divmod(x, 10)
+            table = np.array(digit_powers(first_exponent + i),
+                             dtype=sums.dtype)
+            sums += table[digit]
+        return sums.tolist()
+
+    tables = [digit_powers(first_exponent + i) for i in range(width)]
+    sums = []
+    for x in range(count):
+        total = 0
+        for i in range(width - 1, -1, -1):
+            x, digit = divmod(x, 10)
+            total += tables[i][digit]
+        sums.append(total)
+    return sums
+
+
+def disarium_numbers(a, b):
+    """Disarium numbers (sum of digit_i ** position_i) in [a, b)"""
+    found = [0] if a <= 0 < b else []
+    for length in _lengths(a, b):
+        # The largest possible sum 9 + 9**2 + ... has too few digits
+        if sum(9 ** i for i in range(1, length + 1)) < 10 ** (length - 1):
+            break
+        # n = P * 10**k + S is disarium iff f(P) + g(S) = n, i.e.
+        # P * 10**k - f(P) = g(S) - S, so match the two halves by key
+        k = length // 2
+        head = length - k
+        scale = 10 ** k
+        by_key = {}
+        for s, g in enumerate(_power_sums(scale, k, head + 1)):
+            by_key.setdefault(g - s, []).append(s)
+        low = 10 ** (head - 1)
+        prefix_sums = _power_sums(10 ** head, head, 1)
+        for p in range(low, 10 ** head):
+            for s in by_key.get(p * scale - prefix_sums[p], ()):
+                n = p * scale + s
+                if a <= n < b:
+                    found.append(n)
+    return sorted(found)
+
+
+def automorphic_numbers(a, b):
+    """Automorphic numbers (n*n ends in n) in [a, b)"""
+    found = {n for n in (0, 1) if a <= n < b}
+    for k in range(1, len(str(max(b - 1, 1))) + 1):
+        two, five, mod = 2 ** k, 5 ** k, 10 ** k
+        # n = 0 (mod 2**k) and n = 1 (mod 5**k), or the other way round
+        n = two * pow(two, -1, five) % mod
+        for candidate in (n, (1 - n) % mod):
+            if len(str(candidate)) == k and a <= candidate < b:
+                found.add(candidate)
+    return sorted(found)
+
+
+if __name__ == "__main__":
+    a = int(input("Start of range: "))
+    b = int(input("End of range (exclusive): "))
+    print("Armstrong numbers:", armstrong_numbers(a, b))
+    print("Disarium numbers:", disarium_numbers(a, b))
+    print("Strong numbers:", strong_numbers(a, b))
+    print("Automorphic numbers:", automorphic_numbers(a, b))
+    spy = spy_numbers(a, b)
+    print("Spy numbers:", len(spy), "found, first ones:", spy[:20])
@@ -24,24 +24,128 @@ will give us 2
 
 """
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
 def dig_root(n):
 
     '''
 
     I will try to implement this without using type casting  in my code
 
+    A number and its digit sum leave the same remainder mod 9 (10 = 1 mod 9),
+    so the digital root is 1 + (n - 1) % 9 for n > 0, with no loop at all;
+    a negative n has the digital root of its absolute value
+
+    '''
+
+    n = abs(n)
+    return 0 if n == 0 else 1 + (n - 1) % 9
+
+
+def digit_sum(n):
+
+    '''
+
+    Digit sum of an int, or of a decimal number given as str or bytes
+
+    Surrounding whitespace and one leading sign are allowed; anything else
+    that is not a digit raises ValueError
+
     '''
 
-    div , res = 10, 0
+    if isinstance(n, int):
+        n = str(n).encode()
+    elif isinstance(n, str):
+        n = n.encode()
+    n = n.strip()
+    digits = n[1:] if n[:1] in (b"+", b"-") else n
+    if not digits.isdigit():
+        raise ValueError(f"not a decimal number: {n!r}")
+    # The digits are ASCII 48..57, so summing the bytes does it in one pass
+    return sum(digits) - 48 * len(digits)
 
-    while n > 0:
 
-        res+=n%div
+def digital_root(n):
 
-        n//=div
+    '''Digital root of an int, str or bytes of any length'''
 
-    return res if res<10 else dig_root(res)
+    if isinstance(n, int):
+        return dig_root(abs(n))
+    return dig_root(digit_sum(n))
 
-#print(dig_root(45893))
 
-print(dig_root (int(input())))
+def digital_roots(values):
+
+    '''Digital roots of a whole array of integers'''
+
+    if np is not None:
+        values = np.abs(np.asarray(values))
+        return np.where(values == 0, 0, 1 + (values - 1) % 9)
+    return [dig_root(v) for v in values]
+
+
+def buffer_digit_sums(buffer):
+
+    '''
+
+    Digit sums of every newline-separated number in a byte buffer, as a
+    list; lines holding only whitespace are skipped and any other line
+    that digit_sum() would reject raises ValueError
+
+    With NumPy the whole buffer is turned into digit values at once and the
+    per-line sums come from one reduceat over the line starts
+
+    '''
+
+    if np is None:
+        return [digit_sum(line) for line in buffer.split(b"\n") if line.strip()]
+
+    data = np.frombuffer(buffer, dtype=np.uint8)
+    if data.size == 0:
+        return []
+    newline = data == ord("\n")
+    # Line starts are the first byte and every byte after a newline
+    starts = np.flatnonzero(np.concatenate(([True], newline[:-1])))
+    line_of = np.cumsum(np.concatenate(([0], newline[:-1])))
+    digits = data.astype(np.int64) - 48
+    is_digit = (digits >= 0) & (digits <= 9)
+    digits[~is_digit] = 0
+    sums = np.add.reduceat(digits, starts)
+
+    # Per line: the visible (non-whitespace) bytes must be one contiguous
+    # run of digits with at most a leading sign, as in digit_sum()
+    visible = ~np.isin(data, np.frombuffer(b" \t\n\r\x0b\x0c", dtype=np.uint8))
+    position = np.arange(data.size)
+    count = np.add.reduceat(visible.astype(np.int64), starts)
+    first = np.minimum.reduceat(np.where(visible, position, data.size), starts)
+    last = np.maximum.reduceat(np.where(visible, position, -1), starts)
+    digit_count = np.add.reduceat(is_digit.astype(np.int64), starts)
+    is_sign = (data == ord("+")) | (data == ord("-"))
+    bad = np.zeros(starts.size, dtype=bool)
+    bad[line_of[visible & ~is_digit & ~is_sign]] = True
+    bad[line_of[is_sign & (position != first[line_of])]] = True
+    filled = count > 0
+    bad |= filled & ((last - first + 1 != count) | (digit_count == 0))
+    if bad.any():
+        line = bytes(buffer).split(b"\n")[int(np.argmax(bad))].strip()
+        raise ValueError(f"not a decimal number: {line!r}")
+    return sums[filled].tolist()
+
+
+def file_digital_roots(path):
+
+    '''Digital roots of every number in a file with one number per line'''
+
+    with open(path, "rb") as f:
+        sums = buffer_digit_sums(f.read())
+    return digital_roots(sums)
+
+
+if __name__ == "__main__":
+    #print(dig_root(45893))
+
+    print(dig_root (int(input())))
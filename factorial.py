@@ -1,8 +1,117 @@
+import math
+import timeit
+
+from sieve_of_eratosthenes import sieve_of_eratosthenes
+
+
+def product(values):
+    # Multiply pairwise, level by level, so the operands stay balanced in
+    # size instead of multiplying one huge number by a small one each step
+    values = list(values)
+    if not values:
+        return 1
+    while len(values) > 1:
+        paired = [values[i] * values[i + 1] for i in range(0, len(values) - 1, 2)]
+        if len(values) % 2:
+            paired.append(values[-1])
+        values = paired
+    return values[0]
+
+
+def binary_split_factorial(n):
+    return product(range(2, n + 1))
+
+
+def swing(n, primes):
+    # Swinging factorial n! / ((n//2)!)**2, built from its prime powers:
+    # the exponent of p has one bit per odd floor(n / p**i)
+    factors = []
+    for p in primes:
+        if p > n:
+            break
+        q, pk = n, 1
+        while q:
+            q //= p
+            if q & 1:
+                pk *= p
+        if pk > 1:
+            factors.append(pk)
+    return product(factors)
+
+
+def prime_swing_factorial(n):
+    # Luschny's prime-swing factorial: n! = ((n//2)!)**2 * swing(n),
+    # unrolled from the smallest n // 2**k upwards
+    if n < 0:
+        raise ValueError("factorial is not defined for negative numbers")
+    primes = sieve_of_eratosthenes(n)
+    chain = []
+    while n > 1:
+        chain.append(n)
+        n //= 2
+    result = 1
+    for m in reversed(chain):
+        result = result * result * swing(m, primes)
+    return result
+
+
 def factorial(n):
-     
-    return 1 if (n==1 or n==0) else n * factorial(n - 1);
- 
+    if n < 0:
+        raise ValueError("factorial is not defined for negative numbers")
+    if n < 100:
+        result = 1
+        for i in range(2, n + 1):
+            result *= i
+        return result
+    return prime_swing_factorial(n)
+
+
+class FactorialTable:
+    # Factorials and inverse factorials mod a prime p up to n, so that
+    # nCr(n, r) mod p is two multiplications
+
+    def __init__(self, n, mod=10**9 + 7):
+        if n >= mod:
+            raise ValueError("table size must stay below the prime modulus")
+        self.mod = mod
+        fact = [1] * (n + 1)
+        for i in range(1, n + 1):
+            fact[i] = fact[i - 1] * i % mod
+        inv = [1] * (n + 1)
+        inv[n] = pow(fact[n], mod - 2, mod)
+        for i in range(n, 0, -1):
+            inv[i - 1] = inv[i] * i % mod
+        self.fact = fact
+        self.inv_fact = inv
+
+    def nCr(self, n, r):
+        if r < 0 or r > n:
+            return 0
+        return self.fact[n] * self.inv_fact[r] % self.mod * self.inv_fact[n - r] % self.mod
+
+    def nPr(self, n, r):
+        if r < 0 or r > n:
+            return 0
+        return self.fact[n] * self.inv_fact[n - r] % self.mod
+
+
+def benchmark(sizes=(1000, 10000, 100000), repeat=3):
+    # Best time in seconds of each implementation for every n
+    results = {}
+    for n in sizes:
+        results[n] = {
+            name: min(timeit.repeat(lambda: func(n), number=1, repeat=repeat))
+            for name, func in (("math.factorial", math.factorial),
+                               ("prime_swing", prime_swing_factorial),
+                               ("binary_split", binary_split_factorial))
+        }
+    return results
+
+
+if __name__ == "__main__":
+    num = int(input("Enter a number: "));
 
-num = int(input("Enter a number: "));
+    print("Factorial of",num,"is",factorial(num))
 
-print("Factorial of",num,"is",factorial(num))
+    for n, timings in benchmark().items():
+        print(n, ", ".join(f"{name}: {t:.4f}s" for name, t in timings.items()))
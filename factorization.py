@@ -0,0 +1,76 @@
+# Integer factorisation shared by the factor scripts
+#
+# Small factors are removed by trial division with a cached prime table,
+# whatever is left is split with Brent's variant of Pollard's rho and
+# checked with Miller-Rabin, so 20-digit numbers factor in milliseconds.
+
+import math
+
+from prime import is_prime
+from sieve_of_eratosthenes import sieve_of_eratosthenes
+
+# Primes used for trial division before switching to Pollard's rho
+TRIAL_LIMIT = 10000
+TRIAL_PRIMES = sieve_of_eratosthenes(TRIAL_LIMIT)
+
+
+def brent_rho(n):
+    # Return a non-trivial factor of the odd composite n
+    if n % 2 == 0:
+        return 2
+    batch = 128
+    for c in range(1, n):
+        y, r, q = 2, 1, 1
+        g = 1
+        while g == 1:
+            x = y
+            for _ in range(r):
+                y = (y * y + c) % n
+            k = 0
+            while k < r and g == 1:
+                ys = y
+                # Multiply a batch of differences and take one gcd
+                for _ in range(min(batch, r - k)):
+                    y = (y * y + c) % n
+                    q = q * abs(x - y) % n
+                g = math.gcd(q, n)
+                k += batch
+            r *= 2
+        if g == n:
+            # The batch overshot; step back one term at a time
+            g = 1
+            while g == 1:
+                ys = (ys * ys + c) % n
+                g = math.gcd(abs(x - ys), n)
+        if g != n:
+            return g
+    raise ValueError(f"no factor found for {n}")
+
+
+def factorize(n):
+    # Return the prime factorisation of n as {prime: exponent}
+    if n < 1:
+        raise ValueError("n must be a positive integer")
+    factors = {}
+    for p in TRIAL_PRIMES:
+        if p * p > n:
+            break
+        while n % p == 0:
+            factors[p] = factors.get(p, 0) + 1
+            n //= p
+
+    stack = [n] if n > 1 else []
+    while stack:
+        m = stack.pop()
+        if m < TRIAL_LIMIT ** 2 or is_prime(m):
+            # Anything below TRIAL_LIMIT**2 left after trial division is prime
+            factors[m] = factors.get(m, 0) + 1
+            continue
+        d = brent_rho(m)
+        stack.extend((d, m // d))
+    return dict(sorted(factors.items()))
+
+
+def format_factors(factors):
+    # Format {prime: exponent} as (p**e)(q), e.g. (2**3)(3**2)(5) for 360
+    return ''.join(f'({p}**{e})' if e > 1 else f'({p})' for p, e in factors.items())
@@ -1,6 +1,118 @@
+from math import lcm
+
+
+def fib_pair(n, mod=None):
+  # (F(n), F(n+1)) by iterative fast doubling over the bits of n:
+  # F(2k) = F(k) * (2F(k+1) - F(k)),  F(2k+1) = F(k)^2 + F(k+1)^2
+  a, b = 0, 1
+  for bit in bin(n)[2:]:
+    c = a * (2 * b - a)
+    d = a * a + b * b
+    if mod:
+      c, d = c % mod, d % mod
+    if bit == "1":
+      a, b = d, c + d
+      if mod:
+        b %= mod
+    else:
+      a, b = c, d
+  return a, b
+
+
+def _factorize(n):
+  factors = {}
+  p = 2
+  while p * p <= n:
+    while n % p == 0:
+      factors[p] = factors.get(p, 0) + 1
+      n //= p
+    p += 1
+  if n > 1:
+    factors[n] = factors.get(n, 0) + 1
+  return factors
+
+
+def _pisano_prime(p):
+  # The period of a prime divides p - 1 when p = +-1 (mod 10) and
+  # 2(p + 1) when p = +-3 (mod 10); try the divisors in order
+  if p == 2:
+    return 3
+  if p == 5:
+    return 20
+  bound = p - 1 if p % 10 in (1, 9) else 2 * (p + 1)
+  divisors = {1}
+  for q, e in _factorize(bound).items():
+    divisors |= {d * q ** i for d in divisors for i in range(1, e + 1)}
+  for d in sorted(divisors):
+    if fib_pair(d, p) == (0, 1):
+      return d
+  return bound
+
+
+# Pisano periods computed so far, by modulus
+_PISANO = {}
+
+
+def pisano_period(m):
+  # Period of F(n) mod m, cached per modulus; pi(p^k) = p^(k-1) * pi(p)
+  # and pi is multiplicative over coprime factors via lcm. Finding it
+  # means factoring m by trial division, so it is slow for huge moduli
+  if m not in _PISANO:
+    _PISANO[m] = 1 if m == 1 else lcm(
+      *(p ** (e - 1) * _pisano_prime(p) for p, e in _factorize(m).items()))
+  return _PISANO[m]
+
+
+def _reduction_period(mod, reduce):
+  # Period to reduce indices by: only when it is already known or reduce
+  # is set. Fast doubling is O(log n) anyway, so a plain call never pays
+  # for factoring mod
+  if mod and (reduce or mod in _PISANO):
+    return pisano_period(mod)
+  return None
+
+
+def fibonacci(n, mod=None, reduce=False):
+  period = _reduction_period(mod, reduce)
+  if period:
+    n %= period
+  return fib_pair(n, mod)[0]
+
+
+def fibonacci_many(ns, mod=None, reduce=False):
+  # F(n) for many n at once: every pair is built from the pair of n >> 1,
+  # so sorting the n and memoising the pairs shares the doublings of
+  # common high-bit prefixes. Returns a dict {n: F(n)}
+  period = _reduction_period(mod, reduce)
+  if period:
+    reduced = {n: n % period for n in ns}
+  else:
+    reduced = {n: n for n in ns}
+
+  memo = {0: (0, 1)}
+  for k in sorted(set(reduced.values())):
+    chain = []
+    while k not in memo:
+      chain.append(k)
+      k >>= 1
+    a, b = memo[k]
+    for k in reversed(chain):
+      c = a * (2 * b - a)
+      d = a * a + b * b
+      if mod:
+        c, d = c % mod, d % mod
+      if k & 1:
+        a, b = d, (c + d) % mod if mod else c + d
+      else:
+        a, b = c, d
+      memo[k] = (a, b)
+  return {n: memo[k][0] for n, k in reduced.items()}
+
+
 def fibonacci_of(n):
-  if n in {0, 1}:
-    return n
-  return fibonacci_of(n - 1) + fibonacci_of(n - 2)
-for i in range(1,100):
-  print(fibonacci_of(i))
+  return fibonacci(n)
+
+
+if __name__ == "__main__":
+  for i in range(1,100):
+    print(fibonacci_of(i))
@@ -0,0 +1,164 @@
+# Fuzzy dictionary lookup on top of Levenshtein_distance.py
+
+# Two indexes answer "every dictionary word within distance k of a query":
+#
+# BKTree - a Burkhard-Keller tree. Every child edge is labelled with its
+# distance to the parent, and the triangle inequality means only children
+# with labels in [d - k, d + k] can hold matches.
+#
+# SymSpellIndex - a symmetric deletion index. Every word is stored under all
+# strings obtained by deleting up to max_distance characters; two words within
+# distance k share such a deletion, so a lookup only generates the deletions
+# of the query and verifies the few candidates. The lookup cost depends on
+# the query length and k, not on the dictionary size. As in SymSpell, only
+# the first prefix_length characters are used for the deletions: prefixes of
+# two words within distance k are also within distance k, and the cap keeps
+# the number of keys per word bounded for long words.
+#
+# Both can be built in bulk from a word file (one word per line, anything
+# after the first whitespace is ignored) and saved to / loaded from disk.
+
+import pickle
+
+from Levenshtein_distance import distance, myers_distance
+
+
+def read_words(path):
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            parts = line.split()
+            if parts:
+                yield parts[0]
+
+
+class BKTree:
+
+    def __init__(self, words=()):
+        # every node is [word, {distance: child node}]
+        self.root = None
+        self.size = 0
+        for word in words:
+            self.add(word)
+
+    @classmethod
+    def from_word_file(cls, path):
+        return cls(read_words(path))
+
+    def add(self, word):
+        if self.root is None:
+            self.root = [word, {}]
+            self.size = 1
+            return
+        node = self.root
+        while True:
+            d = myers_distance(word, node[0])
+            if d == 0:
+                return  # already present
+            child = node[1].get(d)
+            if child is None:
+                node[1][d] = [word, {}]
+                self.size += 1
+                return
+            node = child
+
+    def lookup(self, query, max_distance=2):
+        # sorted list of (distance, word) for every word within max_distance
+        if self.root is None:
+            return []
+        found = []
+        stack = [self.root]
+        while stack:
+            word, children = stack.pop()
+            d = myers_distance(query, word)
+            if d <= max_distance:
+                found.append((d, word))
+            for edge, child in children.items():
+                if d - max_distance <= edge <= d + max_distance:
+                    stack.append(child)
+        return sorted(found)
+
+    def save(self, path):
+        with open(path, "wb") as f:
+            pickle.dump((self.root, self.size), f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, path):
+        tree = cls()
+        with open(path, "rb") as f:
+            tree.root, tree.size = pickle.load(f)
+        return tree
+
+
+def deletes(word, max_distance):
+    # every string obtained by deleting up to max_distance characters
+    result = {word}
+    frontier = {word}
+    for _ in range(max_distance):
+        frontier = {w[:i] + w[i + 1:] for w in frontier for i in range(len(w))}
+        result |= frontier
+    return result
+
+
+class SymSpellIndex:
+
+    def __init__(self, words=(), max_distance=2, prefix_length=7):
+        self.max_distance = max_distance
+        self.prefix_length = prefix_length
+        self.words = set()
+        # deletion string -> words it was generated from
+        self.index = {}
+        for word in words:
+            self.add(word)
+
+    @classmethod
+    def from_word_file(cls, path, max_distance=2, prefix_length=7):
+        return cls(read_words(path), max_distance, prefix_length)
+
+    def add(self, word):
+        if word in self.words:
+            return
+        self.words.add(word)
+        for key in deletes(word[:self.prefix_length], self.max_distance):
+            self.index.setdefault(key, []).append(word)
+
+    def lookup(self, query, max_distance=None):
+        # sorted list of (distance, word) for every word within max_distance,
+        # which defaults to the distance the index was built for
+        if max_distance is None:
+            max_distance = self.max_distance
+        if max_distance > self.max_distance:
+            raise ValueError(f"index was built for distances up to {self.max_distance}")
+        candidates = set()
+        for key in deletes(query[:self.prefix_length], max_distance):
+            candidates.update(self.index.get(key, ()))
+        found = []
+        for word in candidates:
+            d = distance(query, word, max_distance)
+            if d <= max_distance:
+                found.append((d, word))
+        return sorted(found)
+
+    def save(self, path):
+        with open(path, "wb") as f:
+            pickle.dump((self.max_distance, self.prefix_length, self.words, self.index), f,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, path):
+        index = cls()
+        with open(path, "rb") as f:
+            (index.max_distance, index.prefix_length,
+             index.words, index.index) = pickle.load(f)
+        return index
+
+
+# driving script
+if __name__ == '__main__':
+    path = input("Word file (one word per line): ")
+    index = SymSpellIndex.from_word_file(path)
+    while True:
+        query = input("Enter a word (empty to quit): ")
+        if not query:
+            break
+        for d, word in index.lookup(query):
+            print(d, word)
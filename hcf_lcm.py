@@ -1,32 +1,96 @@
-#Finding HCF in python
-
-a = int(input("Enter the first number: "))
-b = int(input("Enter the second number: "))
- 
-HCF = 1
- 
-for i in range(2,a+1):
-    if(a%i==0 and b%i==0):
-        HCF = i
- 
-print("First Number is: ",a)
-print("Second Number is: ",b)
-print("HCF of the numbers is: ",HCF)
-
-
-#Finding LCM in python
-a = int(input("Enter the first number: "))
-b = int(input("Enter the second number: "))
- 
-HCF = 1
- 
-for i in range(2,a+1):
-    if(a%i==0 and b%i==0):
-        HCF = i
- 
-print("First Number is: ",a)
-print("Second Number is: ",b)
- 
-LCM = int((a*b)/(HCF))
-print("LCM of the two numbers is: ",LCM)
+#Finding HCF and LCM in python
 
+from functools import reduce
+from math import gcd
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def euclid_gcd(a, b):
+    # Euclid's algorithm: gcd(a, b) = gcd(b, a mod b)
+    a, b = abs(a), abs(b)
+    while b:
+        a, b = b, a % b
+    return a
+
+
+def binary_gcd(a, b):
+    # Stein's binary GCD: only shifts and subtractions
+    a, b = abs(a), abs(b)
+    if a == 0 or b == 0:
+        return a | b
+    # Common power of two, taken from the lowest set bit of a | b
+    shift = ((a | b) & -(a | b)).bit_length() - 1
+    a >>= (a & -a).bit_length() - 1
+    while b:
+        b >>= (b & -b).bit_length() - 1
+        if a > b:
+            a, b = b, a
+        b -= a
+    return a << shift
+
+
+def lcm(a, b):
+    if a == 0 or b == 0:
+        return 0
+    return abs(a // gcd(a, b) * b)
+
+
+def gcd_many(numbers):
+    # HCF of any number of integers; stops early once it reaches 1
+    result = 0
+    for n in numbers:
+        result = gcd(result, n)
+        if result == 1:
+            break
+    return result
+
+
+def lcm_many(numbers):
+    return reduce(lcm, numbers, 1)
+
+
+def pairwise_gcd(xs, ys):
+    # Element-wise gcd of two equally long integer arrays
+    if np is not None:
+        return np.gcd(np.asarray(xs), np.asarray(ys))
+    return list(map(gcd, xs, ys))
+
+
+def product_tree(numbers):
+    # Levels of pairwise products, from the numbers up to their total product
+    tree = [list(numbers)]
+    while len(tree[-1]) > 1:
+        level = tree[-1]
+        tree.append([level[i] * level[i + 1] if i + 1 < len(level) else level[i]
+                     for i in range(0, len(level), 2)])
+    return tree
+
+
+def batch_gcd(moduli):
+    # Bernstein's batch GCD: for every modulus N_i, gcd(N_i, product of the
+    # other moduli), found with a product tree and a remainder tree instead
+    # of comparing all pairs. A result other than 1 means N_i shares a
+    # factor with some other modulus.
+    if not moduli:
+        return []
+    tree = product_tree(moduli)
+    remainders = tree[-1]
+    for level in reversed(tree[:-1]):
+        remainders = [remainders[i // 2] % (n * n) for i, n in enumerate(level)]
+    return [gcd(r // n, n) for r, n in zip(remainders, moduli)]
+
+
+if __name__ == "__main__":
+    a = int(input("Enter the first number: "))
+    b = int(input("Enter the second number: "))
+
+    HCF = binary_gcd(a, b)
+
+    print("First Number is: ",a)
+    print("Second Number is: ",b)
+    print("HCF of the numbers is: ",HCF)
+    print("LCM of the two numbers is: ",lcm(a, b))
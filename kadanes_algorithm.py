@@ -1,18 +1,171 @@
 """
 This algorithm is used to find the largest sum in the given array in O(n) Time complexity
+
+Every function returns (best sum, start, end) with inclusive indices, and
+an all-negative input gives its largest element rather than 0. The
+vectorised variants use the prefix-sum form of the same idea: the best
+subarray ending at j is P[j+1] - min(P[0..j]).
 """
 
-arr=[-1,0,3,4,2,6,-10,5,-9]
+from array import array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class MaxSubarray:
+    """Streaming Kadane: O(1) state, fed one value or one block at a time"""
+
+    def __init__(self):
+        self.count = 0
+        self.best = None
+        self.start = self.end = None
+        self._curr_sum = 0
+        self._curr_start = 0
+
+    def update(self, value):
+        i = self.count
+        self.count += 1
+        # _curr_sum is the best sum of a run ending at the previous element,
+        # or 0 (an empty run starting here) when that would only hurt
+        self._curr_sum += value
+        if self.best is None or self._curr_sum > self.best:
+            self.best, self.start, self.end = self._curr_sum, self._curr_start, i
+        if self._curr_sum <= 0:
+            self._curr_sum, self._curr_start = 0, self.count
+
+    def feed(self, values):
+        for value in values:
+            self.update(value)
+        return self
+
+    def feed_block(self, block):
+        """Same as feed() for an array, vectorised with NumPy when available"""
+        if np is None:
+            return self.feed(block)
+        block = np.asarray(block)
+        if block.size == 0:
+            return self
+        # prefix[0] = 0 stands for extending the carried run, prefix[k] for
+        # starting at block index k; the best run ending at j is then
+        # prefix[j + 1] - min(prefix[..j])
+        prefix = np.concatenate(([0], self._curr_sum + np.cumsum(block)))
+        low = np.minimum.accumulate(prefix[:-1])
+        # On ties the later start wins, like the reset in update()
+        is_low = prefix[:-1] == low
+        low_at = np.maximum.accumulate(np.where(is_low, np.arange(block.size), 0))
+        sums = prefix[1:] - low
+
+        def run_start(k):
+            return self._curr_start if k == 0 else self.count + k
+
+        j = int(np.argmax(sums))
+        if self.best is None or sums[j] > self.best:
+            self.best = sums[j].item()
+            self.start, self.end = run_start(int(low_at[j])), self.count + j
+        # Carry the best run ending at the last element into the next block
+        carry, carry_start = sums[-1].item(), run_start(int(low_at[-1]))
+        self.count += block.size
+        if carry > 0:
+            self._curr_sum, self._curr_start = carry, carry_start
+        else:
+            self._curr_sum, self._curr_start = 0, self.count
+        return self
+
+    def result(self):
+        if self.best is None:
+            raise ValueError("max subarray of an empty sequence")
+        return self.best, self.start, self.end
+
+
+def max_subarray(values):
+    """Best (sum, start, end) over any iterable, in one pass"""
+    return MaxSubarray().feed(values).result()
+
+
+def max_subarray_binary(path, typecode="d", block_size=1 << 20):
+    """Best (sum, start, end) over a file of raw machine-format numbers"""
+    state = MaxSubarray()
+    with open(path, "rb") as f:
+        while True:
+            if np is not None:
+                block = np.fromfile(f, dtype=typecode, count=block_size)
+                if block.size == 0:
+                    break
+            else:
+                block = array(typecode)
+                try:
+                    block.fromfile(f, block_size)
+                except EOFError:
+                    pass
+                if not block:
+                    break
+            state.feed_block(block)
+    return state.result()
+
+
+def max_subarray_rows(matrix):
+    """
+    (sums, starts, ends) of the best subarray of every row of a 2-D array,
+    all rows at once
+    """
+    if np is None:
+        results = [max_subarray(row) for row in matrix]
+        return tuple(list(column) for column in zip(*results))
+    matrix = np.asarray(matrix)
+    rows, n = matrix.shape
+    prefix = np.zeros((rows, n + 1), dtype=np.result_type(matrix, np.int64))
+    np.cumsum(matrix, axis=1, out=prefix[:, 1:])
+    low = np.minimum.accumulate(prefix[:, :-1], axis=1)
+    is_low = prefix[:, :-1] == low
+    low_at = np.maximum.accumulate(np.where(is_low, np.arange(n), 0), axis=1)
+    sums = prefix[:, 1:] - low
+    ends = np.argmax(sums, axis=1)
+    index = np.arange(rows)
+    return sums[index, ends], low_at[index, ends], ends
+
+
+def max_submatrix(matrix):
+    """
+    Maximum-sum rectangle of a 2-D array in O(n^2 * m): for every pair of
+    top and bottom rows the column sums between them are a 1-D problem.
+
+    Returns (sum, top, left, bottom, right) with inclusive bounds.
+    """
+    if np is not None:
+        matrix = np.asarray(matrix)
+        n, m = matrix.shape
+        # column prefix sums over rows: rows top..bottom = C[bottom+1] - C[top]
+        columns = np.zeros((n + 1, m), dtype=np.result_type(matrix, np.int64))
+        np.cumsum(matrix, axis=0, out=columns[1:])
+        best = None
+        for top in range(n):
+            strips = columns[top + 1:] - columns[top]
+            sums, lefts, rights = max_subarray_rows(strips)
+            b = int(np.argmax(sums))
+            if best is None or sums[b] > best[0]:
+                best = (sums[b].item(), top, int(lefts[b]), top + b, int(rights[b]))
+        return best
+
+    n, m = len(matrix), len(matrix[0])
+    best = None
+    for top in range(n):
+        strip = [0] * m
+        for bottom in range(top, n):
+            for j in range(m):
+                strip[j] += matrix[bottom][j]
+            total, left, right = max_subarray(strip)
+            if best is None or total > best[0]:
+                best = (total, top, left, bottom, right)
+    return best
 
-max_sum=0
-curr_sum=0
 
-for i in arr:
-    curr_sum += i
-    max_sum=max(max_sum,curr_sum)
-    
-    if curr_sum<0:
-        curr_sum=0
+if __name__ == "__main__":
+    arr=[-1,0,3,4,2,6,-10,5,-9]
 
+    max_sum, start, end = max_subarray(arr)
 
-print(max_sum)
\ No newline at end of file
+    print(max_sum)
+    print("from index", start, "to index", end)
@@ -8,34 +8,99 @@
 # Output: 2.50000
 # Explanation: merged array = [1,2,3,4] and median is (2 + 3) / 2 = 2.5.
 
+import mmap
+from bisect import bisect_left, bisect_right
+
+
 #nums1 and nums2 are 2 sorted arrays
 def findMedianSortedArrays(A, B):
-        
-        med1 = med2 = i = j = 0
-        n = len(A) + len(B)
-        
-        while (i + j) <= n / 2:
-            if i < len(A) and j < len(B):
-                med2 = med1
-                if A[i] < B[j]:
-                    med1 = A[i]
-                    i += 1
-                else:
-                    med1 = B[j]
-                    j += 1
-            elif i < len(A):
-                med2 = med1
-                med1 = A[i]
-                i += 1
-            elif j < len(B):
-                med2 = med1
-                med1 = B[j]
-                j += 1
-
-        if n % 2 == 0:
-            return (med1 + med2) / 2.0
-        else:
-            return med1
 
+        # Binary search on how many elements of the shorter array go into
+        # the left half of the merged order: O(log min(m, n)), no merging
+        if len(A) > len(B):
+            A, B = B, A
+        m, n = len(A), len(B)
+        if m + n == 0:
+            raise ValueError("median of two empty arrays")
+        half = (m + n + 1) // 2
+        low, high = 0, m
+
+        while low <= high:
+            i = (low + high) // 2      # elements taken from A
+            j = half - i               # elements taken from B
+            a_left = A[i - 1] if i > 0 else float("-inf")
+            a_right = A[i] if i < m else float("inf")
+            b_left = B[j - 1] if j > 0 else float("-inf")
+            b_right = B[j] if j < n else float("inf")
+
+            if a_left <= b_right and b_left <= a_right:
+                left_max = max(a_left, b_left)
+                if (m + n) % 2:
+                    return left_max
+                return (left_max + min(a_right, b_right)) / 2.0
+            if a_left > b_right:
+                high = i - 1
+            else:
+                low = i + 1
+
+
+def kth_of_sorted(arrays, k):
+
+        # k-th smallest element (0-based) across any number of sorted
+        # sequences without merging them. Each round picks the weighted
+        # median of the middle elements of the remaining windows as a pivot
+        # and counts the elements below it with binary search, which drops
+        # at least a quarter of the remaining elements per round
+        lows = [0] * len(arrays)
+        highs = [len(a) for a in arrays]
+        if not 0 <= k < sum(highs):
+            raise IndexError("k is out of range")
+
+        while True:
+            middles = sorted((arrays[i][(lows[i] + highs[i]) // 2], highs[i] - lows[i])
+                             for i in range(len(arrays)) if lows[i] < highs[i])
+            total = sum(weight for _, weight in middles)
+            seen = 0
+            for pivot, weight in middles:
+                seen += weight
+                if 2 * seen >= total:
+                    break
+
+            less = [bisect_left(a, pivot, lo, hi) for a, lo, hi in zip(arrays, lows, highs)]
+            upto = [bisect_right(a, pivot, lo, hi) for a, lo, hi in zip(arrays, lows, highs)]
+            below = sum(l - lo for l, lo in zip(less, lows))
+            through = sum(u - lo for u, lo in zip(upto, lows))
+
+            if k < below:
+                highs = less
+            elif k < through:
+                return pivot
+            else:
+                k -= through
+                lows = upto
+
+
+def median_of_sorted(arrays):
+
+        # Median across sorted shards, e.g. memory-mapped files
+        n = sum(len(a) for a in arrays)
+        if n == 0:
+            raise ValueError("median of empty arrays")
+        if n % 2:
+            return kth_of_sorted(arrays, n // 2)
+        return (kth_of_sorted(arrays, n // 2 - 1) + kth_of_sorted(arrays, n // 2)) / 2.0
+
+
+def open_sorted_file(path, typecode="q"):
+
+        # Memory-map a file of sorted raw machine-format numbers (array
+        # typecode) as an indexable sequence; pages are only read when the
+        # binary search touches them
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return memoryview(mapped).cast(typecode)
 
 
+if __name__ == "__main__":
+        print(findMedianSortedArrays([1, 3], [2]))
+        print(findMedianSortedArrays([1, 2], [3, 4]))
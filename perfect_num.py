@@ -2,10 +2,16 @@
 
 n = int(input("Enter the number : "))
 sum=0
-for i in range(1,n):
+# Divisors come in pairs (i, n//i), so checking up to sqrt(n) is enough
+i=1
+while i*i<=n:
     if n%i==0:
         sum+=i
-if sum==n:
+        if i!=n//i:
+            sum+=n//i
+    i+=1
+sum-=n  # only proper divisors count
+if n>0 and sum==n:
     print("Perfect !")
 else:
     print("Nah !")
@@ -1,8 +1,87 @@
+import timeit
+
+
 def power_of_a_linear(x, n):
     if n == 0:
         return 1
     return x * power_of_a_linear(x, n-1)
 
-x = int(input("Enter the number:"))
-n = int(input("Enter the power:"))
-print(power_of_a_linear(x, n))
+
+def fast_power(base, n, multiply, identity):
+    # Iterative square-and-multiply: O(log n) multiplications for any
+    # associative multiply (ints, matrices, polynomials, ...)
+    if n < 0:
+        raise ValueError("negative exponents are not supported")
+    result = identity
+    while n:
+        if n & 1:
+            result = multiply(result, base)
+        n >>= 1
+        if n:
+            base = multiply(base, base)
+    return result
+
+
+def power(x, n, mod=None):
+    if mod is None:
+        return fast_power(x, n, lambda a, b: a * b, 1)
+    return fast_power(x % mod, n, lambda a, b: a * b % mod, 1 % mod)
+
+
+def mat_mul(A, B, mod=None):
+    # Product of two small matrices given as lists of rows
+    columns = list(zip(*B))
+    product = [[sum(a * b for a, b in zip(row, col)) for col in columns] for row in A]
+    if mod is not None:
+        product = [[v % mod for v in row] for row in product]
+    return product
+
+
+def mat_pow(M, n, mod=None):
+    # M^n, e.g. [[1, 1], [1, 0]]^n holds F(n) for linear recurrences
+    one = 1 if mod is None else 1 % mod
+    identity = [[one if i == j else 0 for j in range(len(M))] for i in range(len(M))]
+    return fast_power(M, n, lambda A, B: mat_mul(A, B, mod), identity)
+
+
+def poly_mul(P, Q, mod=None, max_degree=None):
+    # Product of polynomials given as coefficient lists, lowest degree
+    # first; max_degree truncates the result (power series arithmetic)
+    size = len(P) + len(Q) - 1
+    if max_degree is not None:
+        size = min(size, max_degree + 1)
+    product = [0] * size
+    for i, p in enumerate(P):
+        if p == 0 or i >= size:
+            continue
+        for j, q in enumerate(Q[:size - i]):
+            product[i + j] += p * q
+    if mod is not None:
+        product = [v % mod for v in product]
+    return product
+
+
+def poly_pow(P, n, mod=None, max_degree=None):
+    identity = [1 if mod is None else 1 % mod]
+    return fast_power(P, n, lambda A, B: poly_mul(A, B, mod, max_degree), identity)
+
+
+def benchmark(cases=((3, 10**5, None), (3, 10**18, 10**9 + 7)), repeat=5):
+    # Best time in seconds of power() and the built-in pow for each
+    # (base, exponent, modulus) case
+    results = {}
+    for x, n, mod in cases:
+        results[(x, n, mod)] = {
+            "power": min(timeit.repeat(lambda: power(x, n, mod), number=1, repeat=repeat)),
+            "pow": min(timeit.repeat(lambda: pow(x, n, mod), number=1, repeat=repeat)),
+        }
+    return results
+
+
+if __name__ == "__main__":
+    x = int(input("Enter the number:"))
+    n = int(input("Enter the power:"))
+    print(power(x, n))
+
+    for case, timings in benchmark().items():
+        print(case, ", ".join(f"{name}: {t:.6f}s" for name, t in timings.items()))
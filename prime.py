@@ -1,20 +1,80 @@
-def prime(x, y):
-    prime_list = []
-    for i in range(x, y):
-        if i == 0 or i == 1:
+from math import gcd, isqrt
+
+from prime_table import find_table
+from sieve_of_eratosthenes import iter_primes
+
+# Small primes used to reject most composites before Miller-Rabin
+SMALL_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47, 53,
+                59, 61, 67, 71, 73, 79, 83, 89, 97)
+SMALL_PRIMORIAL = 1
+for _p in SMALL_PRIMES:
+    SMALL_PRIMORIAL *= _p
+
+# Witness sets that make Miller-Rabin deterministic below the given bound
+MR_BASES_64 = (2, 325, 9375, 28178, 450775, 9780504, 1795265022)   # n < 2**64
+MR_BASES_LARGE = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)  # n < 3.3e24
+
+
+def is_prime(n):
+    # Deterministic Miller-Rabin for n < 3.3e24 (and a very strong
+    # probable-prime test beyond that), after a small-prime pre-filter
+    if n < 2:
+        return False
+    if n <= SMALL_PRIMES[-1]:
+        return n in SMALL_PRIMES
+    if gcd(n, SMALL_PRIMORIAL) != 1:
+        return False
+    if n < SMALL_PRIMES[-1] ** 2:
+        return True
+
+    d = n - 1
+    s = 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+
+    bases = MR_BASES_64 if n < 1 << 64 else MR_BASES_LARGE
+    for a in bases:
+        a %= n
+        if a == 0:
+            continue
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
             continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
         else:
-            for j in range(2, int(i/2)+1):
-                if i % j == 0:
-                    break
-            else:
-                prime_list.append(i)
-    return prime_list
- 
-starting_range = 2
-ending_range = 7
-lst = prime(starting_range, ending_range)
-if len(lst) == 0:
-    print("There are no prime numbers in this range")
-else:
-    print("The prime numbers in this range are: ", lst)
+            return False
+    return True
+
+
+def primes_in_range(x, y):
+    # Primes in [x, y). A segmented sieve costs about (y - x) + sqrt(y) work
+    # while testing each number costs about (y - x) Miller-Rabin rounds, so
+    # sieve when the window is not tiny compared to sqrt(y). A prebuilt
+    # prime table (see prime_table.py) that covers the window beats both
+    x = max(x, 2)
+    if x >= y:
+        return []
+    table = find_table()
+    if table is not None and y - 1 <= table.bound:
+        return table.primes_between(x, y)
+    if (y - x) * 8 >= isqrt(y):
+        return list(iter_primes(x, y))
+    return [i for i in range(x, y) if is_prime(i)]
+
+
+def prime(x, y):
+    return primes_in_range(x, y)
+
+
+if __name__ == "__main__":
+    starting_range = 2
+    ending_range = 7
+    lst = prime(starting_range, ending_range)
+    if len(lst) == 0:
+        print("There are no prime numbers in this range")
+    else:
+        print("The prime numbers in this range are: ", lst)
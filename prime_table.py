@@ -0,0 +1,208 @@
+"""
+Persistent prime table - build primes up to a bound once, then mmap them
+
+The table is an odd-only bitset (bit i set means 2*i + 1 is prime), so the
+primes up to 10**9 take about 60 MB on disk. Loading only maps the file,
+which makes startup almost free and lets several processes share the pages.
+
+File layout:
+    8 bytes   magic b"PRIMEBIT"
+    8 bytes   bound, little-endian unsigned
+    rest      bitset of the odd numbers 1, 3, 5, ... up to bound
+"""
+
+import mmap
+import os
+
+from sieve_of_eratosthenes import packed_segments
+
+MAGIC = b"PRIMEBIT"
+HEADER_SIZE = 16
+
+DEFAULT_BOUND = 10 ** 8
+DEFAULT_PATH = os.environ.get(
+    "PRIME_TABLE_PATH",
+    os.path.join(os.path.expanduser("~"), ".cache", "prime_table.bin"),
+)
+
+# Set bit positions of every byte value, used when scanning the bitset
+_BITS = [tuple(i for i in range(8) if b >> i & 1) for b in range(256)]
+
+
+def build_table(bound=DEFAULT_BOUND, path=DEFAULT_PATH):
+    """
+    Sieve the primes up to bound and write them as a bitset file
+
+    The table is written to a temporary file next to path and renamed into
+    place, so an interrupted build never leaves a partial table behind and
+    processes that have the old file mapped keep reading it safely.
+
+    Args:
+        bound: Largest number covered by the table
+        path: Output file
+
+    Returns:
+        The path written
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(MAGIC + bound.to_bytes(8, "little"))
+            for chunk in packed_segments(bound):
+                f.write(chunk)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return path
+
+
+def table_size(bound):
+    """Size in bytes of a table file covering numbers up to bound"""
+    return HEADER_SIZE + ((bound + 1) // 2 + 7) // 8
+
+
+class PrimeTable:
+    """Read-only view of a prime bitset file"""
+
+    def __init__(self, path=DEFAULT_PATH):
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._map[:8] != MAGIC:
+            self._map.close()
+            raise ValueError(f"{path} is not a prime table")
+        self.bound = int.from_bytes(self._map[8:HEADER_SIZE], "little")
+        if len(self._map) != table_size(self.bound):
+            self._map.close()
+            raise ValueError(f"{path} is truncated or corrupt")
+        self.path = path
+
+    def close(self):
+        self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _check(self, n):
+        if n > self.bound:
+            raise ValueError(f"{n} is beyond the table bound {self.bound}")
+
+    def is_prime(self, n):
+        """O(1) primality lookup for n <= bound"""
+        self._check(n)
+        if n < 3:
+            return n == 2
+        if n % 2 == 0:
+            return False
+        i = n // 2
+        return bool(self._map[HEADER_SIZE + i // 8] >> (i % 8) & 1)
+
+    def iter_between(self, a, b):
+        """Yield the primes in [a, b) in increasing order"""
+        if b <= a:
+            return
+        self._check(b - 1)
+        if a <= 2 < b:
+            yield 2
+        first = max(a, 3) // 2        # odd index of the first candidate
+        last = (b - 2) // 2           # odd index of the last odd number < b
+        if last < first:
+            return
+        data = self._map[HEADER_SIZE + first // 8:HEADER_SIZE + last // 8 + 1]
+        base = first // 8 * 8
+        for k, byte in enumerate(data):
+            for bit in _BITS[byte]:
+                i = base + 8 * k + bit
+                if first <= i <= last:
+                    yield 2 * i + 1
+
+    def primes_between(self, a, b):
+        """List of the primes in [a, b)"""
+        return list(self.iter_between(a, b))
+
+
+_table = None
+
+
+def get_table(bound=None, path=DEFAULT_PATH):
+    """
+    Return the shared prime table, building the file if it is missing or
+    does not reach bound
+
+    Args:
+        bound: Smallest acceptable table bound (default: any existing table,
+            or DEFAULT_BOUND when one has to be built)
+        path: Table file
+
+    Returns:
+        PrimeTable instance
+    """
+    global _table
+    if (_table is not None and _table.path == path
+            and (bound is None or _table.bound >= bound)):
+        return _table
+    if _table is not None:
+        _table.close()
+        _table = None
+
+    try:
+        table = PrimeTable(path)
+    except (OSError, ValueError):
+        table = None
+    if table is None or (bound is not None and table.bound < bound):
+        if table is not None:
+            table.close()
+        build_table(bound or DEFAULT_BOUND, path)
+        table = PrimeTable(path)
+    _table = table
+    return _table
+
+
+def find_table(path=DEFAULT_PATH):
+    """
+    Return the shared prime table if its file already exists, without
+    building one
+
+    Args:
+        path: Table file
+
+    Returns:
+        PrimeTable instance, or None when there is no valid table file
+    """
+    global _table
+    if _table is not None and _table.path == path:
+        return _table
+    try:
+        table = PrimeTable(path)
+    except (OSError, ValueError):
+        return None
+    if _table is not None:
+        _table.close()
+    _table = table
+    return _table
+
+
+def is_prime(n):
+    """Primality lookup in the shared table"""
+    return get_table().is_prime(n)
+
+
+def primes_between(a, b):
+    """Primes in [a, b) from the shared table"""
+    return get_table().primes_between(a, b)
+
+
+if __name__ == "__main__":
+    bound = int(input(f"Table bound (default {DEFAULT_BOUND}): ") or DEFAULT_BOUND)
+    table = get_table(bound)
+    print(f"Prime table at {table.path} covers numbers up to {table.bound}")
+    a = int(input("Start of range: "))
+    b = int(input("End of range (exclusive): "))
+    print(table.primes_between(a, b))
@@ -1,38 +1,245 @@
 """
 Sieve of Eratosthenes - Efficient algorithm to find all primes up to n
 Time Complexity: O(n log log n)
-Space Complexity: O(n)
+Space Complexity: O(n) bytes (n/2 with the odd-only sieve, 8n/30 with wheel-30,
+n/16 with the bit-packed segmented sieve)
 """
 
-def sieve_of_eratosthenes(n):
+import multiprocessing
+import os
+from array import array
+from itertools import compress
+from math import isqrt
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Odd numbers per segment: a 256 KiB bytearray fits in a typical L2 cache
+SEGMENT_SIZE = 1 << 18
+
+# Above this bound count_primes() switches from the sieve to Lucy_Hedgehog
+LUCY_THRESHOLD = 10 ** 5
+
+# Residues modulo 30 that are coprime to 2, 3 and 5 (the wheel-30 spokes)
+WHEEL_30 = (1, 7, 11, 13, 17, 19, 23, 29)
+
+# Translation tables that turn a 0/1 flag byte into bit i
+_SHIFT = [bytes.maketrans(b"\x00\x01", bytes([0, 1 << i])) for i in range(8)]
+
+
+def odd_sieve(n):
+    """
+    Odd-only sieve stored in a bytearray
+
+    Args:
+        n: Upper limit (inclusive)
+
+    Returns:
+        bytearray where entry i is 1 if 2*i + 1 is prime
+    """
+    size = (n + 1) // 2
+    sieve = bytearray([1]) * size
+    if size:
+        sieve[0] = 0  # 1 is not prime
+
+    i = 1
+    while (2 * i + 1) ** 2 <= n:
+        if sieve[i]:
+            p = 2 * i + 1
+            # Multiples of p from p*p step by 2p, i.e. by p in odd-index space
+            start = p * p // 2
+            sieve[start::p] = bytes(len(range(start, size, p)))
+        i += 1
+    return sieve
+
+
+def wheel_sieve(n):
+    """
+    Wheel-30 sieve: one bytearray per residue coprime to 30
+
+    Args:
+        n: Upper limit (inclusive)
+
+    Returns:
+        List of 8 bytearrays; rows[j][k] is 1 if 30*k + WHEEL_30[j] is prime
+    """
+    length = n // 30 + 1
+    rows = [bytearray([1]) * length for _ in WHEEL_30]
+    rows[0][0] = 0  # 1 is not prime
+    # Trim entries past n in the last block
+    for j, r in enumerate(WHEEL_30):
+        if 30 * (length - 1) + r > n:
+            rows[j][length - 1] = 0
+
+    index = {r: j for j, r in enumerate(WHEEL_30)}
+    k = 0
+    while k == 0 or (30 * k + 1) ** 2 <= n:
+        for j, r in enumerate(WHEEL_30):
+            p = 30 * k + r
+            if p == 1 or p * p > n or not rows[j][k]:
+                continue
+            # Multiples p*m with m coprime to 30 and m >= p; for a fixed
+            # residue of m they land in one row and step by p in it
+            for m_res in WHEEL_30:
+                m = p + (m_res - p) % 30
+                start = p * m
+                row = rows[index[start % 30]]
+                first = start // 30
+                if first < length:
+                    row[first::p] = bytes(len(range(first, length, p)))
+        k += 1
+    return rows
+
+
+def pack_flags(flags):
+    """
+    Pack a bytearray of 0/1 flags into bits
+
+    Args:
+        flags: bytearray whose length is a multiple of 8
+
+    Returns:
+        bytes where bit i % 8 of byte i // 8 is flags[i]
+    """
+    value = 0
+    for i in range(8):
+        value |= int.from_bytes(flags[i::8].translate(_SHIFT[i]), "little")
+    return value.to_bytes(len(flags) // 8, "little")
+
+
+def packed_segments(n, segment_size=SEGMENT_SIZE):
+    """
+    Yield the odd-only sieve up to n packed into bits, one segment at a time
+
+    Args:
+        n: Upper limit (inclusive)
+        segment_size: Odd numbers sieved per segment (a multiple of 8)
+
+    Yields:
+        bytes chunks; concatenated, bit i % 8 of byte i // 8 is 1 if
+        2*i + 1 is prime
+    """
+    odd_count = (n + 1) // 2
+    # Round up to whole bytes; the padding bits are cleared below
+    odd_total = (odd_count + 7) // 8 * 8
+    base_primes = sieve_of_eratosthenes(isqrt(n))[1:]
+    for first in range(0, odd_total, segment_size):
+        size = min(segment_size, odd_total - first)
+        low = 2 * first + 1
+        segment = sieve_segment(low, low + 2 * size, base_primes)
+        if first == 0:
+            segment[0] = 0  # 1 is not prime
+        # Clear the flags past n in the last segment
+        valid = odd_count - first
+        if valid < size:
+            segment[valid:] = bytes(size - valid)
+        yield pack_flags(segment)
+
+
+def packed_sieve(n, segment_size=SEGMENT_SIZE):
+    """
+    Odd-only sieve packed into bits
+
+    Only the bitset and one segment are alive at once, so n = 10**9 needs
+    about 60 MB instead of the 500 MB of odd_sieve().
+
+    Args:
+        n: Upper limit (inclusive)
+        segment_size: Odd numbers sieved per segment (a multiple of 8)
+
+    Returns:
+        bytearray where bit i % 8 of byte i // 8 is 1 if 2*i + 1 is prime
+    """
+    bits = bytearray(((n + 1) // 2 + 7) // 8)
+    pos = 0
+    for chunk in packed_segments(n, segment_size):
+        bits[pos:pos + len(chunk)] = chunk
+        pos += len(chunk)
+    return bits
+
+
+def sieve_of_eratosthenes(n, wheel=False):
     """
     Find all prime numbers up to n using Sieve of Eratosthenes
     
     Args:
         n: Upper limit (inclusive)
+        wheel: Use the wheel-30 sieve instead of the odd-only one
     
     Returns:
         List of all prime numbers up to n
     """
     if n < 2:
         return []
-    
-    # Create a boolean array "prime[0..n]" and initialize all entries as true
-    prime = [True] * (n + 1)
-    prime[0] = prime[1] = False
-    
-    p = 2
-    while p * p <= n:
-        # If prime[p] is not changed, then it's a prime
-        if prime[p]:
-            # Mark all multiples of p as not prime
-            for i in range(p * p, n + 1, p):
-                prime[i] = False
-        p += 1
-    
-    # Collect all prime numbers
-    primes = [i for i in range(n + 1) if prime[i]]
-    return primes
+
+    if not wheel:
+        return [2] + list(compress(range(1, n + 1, 2), odd_sieve(n)))
+
+    rows = wheel_sieve(n)
+    length = len(rows[0])
+    # Interleave the rows so primes come out in increasing order
+    flags = bytearray(8 * length)
+    for j, row in enumerate(rows):
+        flags[j::8] = row
+    candidates = (30 * k + r for k in range(length) for r in WHEEL_30)
+    return [p for p in (2, 3, 5) if p <= n] + list(compress(candidates, flags))
+
+
+def sieve_segment(low, high, base_primes):
+    """
+    Sieve the odd numbers of one segment [low, high)
+
+    Args:
+        low: Odd start of the segment (at least 3)
+        high: End of the segment (exclusive)
+        base_primes: Odd primes up to at least sqrt(high - 1), ascending
+
+    Returns:
+        bytearray where entry i is 1 if low + 2*i is prime
+    """
+    size = (high - low + 1) // 2
+    segment = bytearray([1]) * size
+    for p in base_primes:
+        if p * p >= high:
+            break
+        # First odd multiple of p in the segment that is not p itself
+        start = max(p * p, (low + p - 1) // p * p)
+        if start % 2 == 0:
+            start += p
+        i = (start - low) // 2
+        segment[i::p] = bytes(len(range(i, size, p)))
+    return segment
+
+
+def iter_primes(start, stop, segment_size=SEGMENT_SIZE):
+    """
+    Lazily yield the primes in [start, stop) with a segmented sieve
+
+    Memory stays at one segment plus the primes up to sqrt(stop), so
+    windows far from zero such as [10**12, 10**12 + 10**9) can be streamed.
+
+    Args:
+        start: Lower bound (inclusive)
+        stop: Upper bound (exclusive)
+        segment_size: Odd numbers sieved per segment
+
+    Yields:
+        Prime numbers in increasing order
+    """
+    start = max(start, 2)
+    if start >= stop:
+        return
+    if start == 2:
+        yield 2
+
+    base_primes = sieve_of_eratosthenes(isqrt(stop - 1))[1:]
+    span = 2 * segment_size
+    for low in range(start | 1, stop, span):
+        high = min(low + span, stop)
+        yield from compress(range(low, high, 2),
+                            sieve_segment(low, high, base_primes))
 
 
 def segmented_sieve(n):
@@ -45,41 +252,169 @@ def segmented_sieve(n):
     Returns:
         List of prime numbers
     """
+    return list(iter_primes(2, n + 1))
+
+
+# Base primes shared with pool workers, set once per process by _init_worker
+_BASE_PRIMES = None
+
+
+def _init_worker(base_primes):
+    global _BASE_PRIMES
+    _BASE_PRIMES = base_primes
+
+
+def _sieve_task(task):
+    """Sieve one task range in a worker; count primes or write them to a file"""
+    low, high, segment_size, path = task
+    span = 2 * segment_size
+    count = 0
+    out = array("Q") if path else None
+    for seg_low in range(low, high, span):
+        seg_high = min(seg_low + span, high)
+        segment = sieve_segment(seg_low, seg_high, _BASE_PRIMES)
+        if out is None:
+            count += segment.count(1)
+        else:
+            out.extend(compress(range(seg_low, seg_high, 2), segment))
+    if out is not None:
+        count = len(out)
+        with open(path, "wb") as f:
+            out.tofile(f)
+    return count
+
+
+def _parallel_sieve(start, stop, processes, segment_size, segments_per_task,
+                    out_dir):
+    start = max(start, 2)
+    if start >= stop:
+        return 0, []
+
+    base_primes = array("Q", sieve_of_eratosthenes(isqrt(stop - 1))[1:])
+    # An even task span keeps every task starting on an odd number
+    task_span = 2 * segment_size * segments_per_task
+    tasks = []
+    for index, low in enumerate(range(start | 1, stop, task_span)):
+        path = None
+        if out_dir is not None:
+            path = os.path.join(out_dir, f"primes_{index:06d}.bin")
+        tasks.append((low, min(low + task_span, stop), segment_size, path))
+
+    with multiprocessing.Pool(processes, _init_worker, (base_primes,)) as pool:
+        counts = pool.map(_sieve_task, tasks)
+
+    total = sum(counts) + (1 if start == 2 else 0)
+    return total, [task[3] for task in tasks]
+
+
+def parallel_count_primes(start, stop, processes=None,
+                          segment_size=SEGMENT_SIZE, segments_per_task=16):
+    """
+    Count the primes in [start, stop) across a process pool
+
+    Args:
+        start: Lower bound (inclusive)
+        stop: Upper bound (exclusive)
+        processes: Number of worker processes (default: CPU count)
+        segment_size: Odd numbers sieved per segment
+        segments_per_task: Segments handed to a worker at a time
+
+    Returns:
+        Count of primes
+    """
+    total, _ = _parallel_sieve(start, stop, processes, segment_size,
+                               segments_per_task, None)
+    return total
+
+
+def parallel_write_primes(start, stop, out_dir, processes=None,
+                          segment_size=SEGMENT_SIZE, segments_per_task=16):
+    """
+    Write the primes in [start, stop) to per-task binary files in parallel
+
+    Each file holds native uint64 values (array typecode "Q") and the files
+    are numbered so that reading them in order gives the primes ascending.
+    The prime 2 is not written since every task sieves odd numbers only.
+
+    Args:
+        start: Lower bound (inclusive)
+        stop: Upper bound (exclusive)
+        out_dir: Directory for the primes_NNNNNN.bin files
+        processes: Number of worker processes (default: CPU count)
+        segment_size: Odd numbers sieved per segment
+        segments_per_task: Segments handed to a worker at a time
+
+    Returns:
+        Tuple of (count of primes including 2, list of file paths in order)
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    return _parallel_sieve(start, stop, processes, segment_size,
+                           segments_per_task, out_dir)
+
+
+def lucy_count_primes(n):
+    """
+    Count primes up to n with the Lucy_Hedgehog method
+
+    Keeps S(v) = number of primes <= v only for the O(sqrt(n)) distinct
+    values v = n // i and removes the multiples of each prime p <= sqrt(n)
+    in turn. Time O(n^(3/4)), memory O(sqrt(n)). With NumPy the updates
+    for each prime run as array operations (n < 2**62).
+
+    Args:
+        n: Upper limit
+
+    Returns:
+        Count of primes
+    """
     if n < 2:
-        return []
-    
-    # Find all primes up to sqrt(n)
-    limit = int(n ** 0.5) + 1
-    base_primes = sieve_of_eratosthenes(limit)
-    
-    # For small n, just return the result
-    if n <= limit:
-        return [p for p in base_primes if p <= n]
-    
-    # Use segmented approach for larger numbers
-    primes = base_primes.copy()
-    segment_size = limit
-    
-    for low in range(limit + 1, n + 1, segment_size):
-        high = min(low + segment_size - 1, n)
-        
-        # Create a segment
-        segment = [True] * (high - low + 1)
-        
-        # Use base primes to mark multiples in this segment
-        for prime in base_primes:
-            # Find the minimum number in [low, high] that is a multiple of prime
-            start = max(prime * prime, ((low + prime - 1) // prime) * prime)
-            
-            for j in range(start, high + 1, prime):
-                segment[j - low] = False
-        
-        # Add primes from this segment
-        for i in range(len(segment)):
-            if segment[i]:
-                primes.append(low + i)
-    
-    return primes
+        return 0
+    r = isqrt(n)
+    if np is not None and n < 1 << 62:
+        return _lucy_count_primes_numpy(n, r)
+    # small[v] = S(v) for v <= r, large[i] = S(n // i) for i <= r
+    small = [v - 1 for v in range(r + 1)]
+    small[0] = 0
+    large = [0] + [n // i - 1 for i in range(1, r + 1)]
+
+    for p in range(2, r + 1):
+        if small[p] == small[p - 1]:
+            continue  # p is not prime
+        sp = small[p - 1]
+        p2 = p * p
+        for i in range(1, min(r, n // p2) + 1):
+            d = i * p
+            large[i] -= (large[d] if d <= r else small[n // d]) - sp
+        for v in range(r, p2 - 1, -1):
+            small[v] -= small[v // p] - sp
+    return large[1]
+
+
+def _lucy_count_primes_numpy(n, r):
+    """lucy_count_primes() with each prime's updates done as array operations"""
+    small = np.arange(-1, r, dtype=np.int64)
+    small[0] = 0
+    index = np.arange(r + 1, dtype=np.int64)
+    # quotient[i] = n // i, so n // (i * p) is quotient[i] // p
+    quotient = np.zeros(r + 1, dtype=np.int64)
+    quotient[1:] = n // index[1:]
+    large = quotient - 1
+    large[0] = 0
+
+    # Every update below reads values from before the current prime's
+    # round, exactly like the ascending/descending loops of the list version
+    for p in sieve_of_eratosthenes(r):
+        sp = small[p - 1]
+        p2 = p * p
+        last = min(r, n // p2)
+        # large[i] for i * p <= r comes from large, the rest from small
+        split = min(last, r // p)
+        large[1:split + 1] -= large[p:split * p + 1:p] - sp
+        if split < last:
+            large[split + 1:last + 1] -= small[quotient[split + 1:last + 1] // p] - sp
+        if p2 <= r:
+            small[p2:] -= small[index[p2:] // p] - sp
+    return int(large[1])
 
 
 def count_primes(n):
@@ -92,7 +427,12 @@ def count_primes(n):
     Returns:
         Count of primes
     """
-    return len(sieve_of_eratosthenes(n))
+    if n < 2:
+        return 0
+    if n > LUCY_THRESHOLD:
+        return lucy_count_primes(n)
+    # Count the flags directly instead of building the list
+    return 1 + odd_sieve(n).count(1)
 
 
 if __name__ == "__main__":
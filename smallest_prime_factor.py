@@ -0,0 +1,169 @@
+"""
+Smallest-prime-factor table - factorise every integer of a range at once
+
+spf_table(n) stores the smallest prime factor of every k <= n in an int32
+array, after which any k factors in O(log k) divisions. For whole ranges,
+range_functions(a, b) sieves [a, b) by the primes up to sqrt(b) and gets
+big omega, omega, Euler's phi and Moebius mu for every number in one pass.
+NumPy is used for the array work when it is installed.
+"""
+
+from array import array
+from math import isqrt
+
+from sieve_of_eratosthenes import sieve_of_eratosthenes
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def spf_table(n):
+    """
+    Smallest prime factor of every integer up to n
+
+    Args:
+        n: Upper limit (inclusive)
+
+    Returns:
+        int32 array (NumPy array or array("i")) with spf[k] = smallest
+        prime factor of k, spf[0] = 0 and spf[1] = 1
+    """
+    primes = sieve_of_eratosthenes(isqrt(n))
+    if np is not None:
+        spf = np.arange(n + 1, dtype=np.int32)
+        # Largest primes first so the smallest factor is written last
+        for p in reversed(primes):
+            spf[p * p::p] = p
+        return spf
+
+    spf = array("i", range(n + 1))
+    for p in reversed(primes):
+        spf[p * p::p] = array("i", [p]) * len(range(p * p, n + 1, p))
+    return spf
+
+
+def factorize(k, spf):
+    """
+    Factorise k with a smallest-prime-factor table
+
+    Args:
+        k: Positive integer covered by the table
+        spf: Table from spf_table()
+
+    Returns:
+        Dict of {prime: exponent}
+    """
+    factors = {}
+    while k > 1:
+        p = int(spf[k])
+        e = 0
+        while k % p == 0:
+            k //= p
+            e += 1
+        factors[p] = e
+    return factors
+
+
+def factorize_range(a, b, spf=None):
+    """
+    Yield (k, {prime: exponent}) for every k in [a, b)
+
+    Args:
+        a: Lower bound (inclusive, at least 1)
+        b: Upper bound (exclusive)
+        spf: Table covering b - 1; built when not given
+    """
+    a = max(a, 1)
+    if a >= b:
+        return
+    if spf is None:
+        spf = spf_table(b - 1)
+    for k in range(a, b):
+        yield k, factorize(k, spf)
+
+
+def range_functions(a, b):
+    """
+    Big omega, omega, phi and mu for every integer in [a, b)
+
+    Each prime p <= sqrt(b) visits its multiples (and the multiples of its
+    powers) in the window; the cofactor left afterwards is 1 or one prime
+    larger than sqrt(b).
+
+    Args:
+        a: Lower bound (inclusive, at least 1)
+        b: Upper bound (exclusive)
+
+    Returns:
+        Dict with keys "big_omega" (prime factors with multiplicity),
+        "omega" (distinct prime factors), "phi" and "mu"; each value is a
+        sequence whose entry i belongs to a + i
+    """
+    if a < 1:
+        raise ValueError("range must start at 1 or above")
+    size = max(b - a, 0)
+    primes = sieve_of_eratosthenes(isqrt(b - 1)) if size else []
+
+    if np is not None:
+        rest = np.arange(a, a + size, dtype=np.int64)
+        phi = rest.copy()
+        big_omega = np.zeros(size, dtype=np.int8)
+        omega = np.zeros(size, dtype=np.int8)
+        mu = np.ones(size, dtype=np.int8)
+        for p in primes:
+            hit = slice((-a) % p, size, p)
+            omega[hit] += 1
+            mu[hit] *= -1
+            phi[hit] = phi[hit] // p * (p - 1)
+            pk = p
+            while pk < b:
+                hit = slice((-a) % pk, size, pk)
+                rest[hit] //= p
+                big_omega[hit] += 1
+                if pk != p:
+                    mu[hit] = 0
+                pk *= p
+        big = rest > 1
+        omega += big
+        big_omega += big
+        mu[big] *= -1
+        phi[big] = phi[big] // rest[big] * (rest[big] - 1)
+        return {"big_omega": big_omega, "omega": omega, "phi": phi, "mu": mu}
+
+    rest = list(range(a, a + size))
+    phi = rest[:]
+    big_omega = [0] * size
+    omega = [0] * size
+    mu = [1] * size
+    for p in primes:
+        for i in range((-a) % p, size, p):
+            omega[i] += 1
+            mu[i] = -mu[i]
+            phi[i] = phi[i] // p * (p - 1)
+        pk = p
+        while pk < b:
+            for i in range((-a) % pk, size, pk):
+                rest[i] //= p
+                big_omega[i] += 1
+                if pk != p:
+                    mu[i] = 0
+            pk *= p
+    for i, r in enumerate(rest):
+        if r > 1:
+            omega[i] += 1
+            big_omega[i] += 1
+            mu[i] = -mu[i]
+            phi[i] = phi[i] // r * (r - 1)
+    return {"big_omega": big_omega, "omega": omega, "phi": phi, "mu": mu}
+
+
+if __name__ == "__main__":
+    a = int(input("Start of range: "))
+    b = int(input("End of range (exclusive): "))
+    values = range_functions(a, b)
+    for i, (k, factors) in enumerate(factorize_range(a, b)):
+        print(k, factors, "Omega =", values["big_omega"][i],
+              "omega =", values["omega"][i], "phi =", values["phi"][i],
+              "mu =", values["mu"][i])
@@ -14,17 +14,86 @@ print(sum_divisors(102))
 # 114
  """
 
+from math import isqrt
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def sigma(n):
+    # Sum of all divisors of n from its factorisation:
+    # sigma(p1**e1 * p2**e2 ...) = prod((p**(e+1) - 1) // (p - 1))
+    # Trial division only runs to sqrt(n), so this is O(sqrt(n))
+    total = 1
+    p = 2
+    while p * p <= n:
+        if n % p == 0:
+            pk = 1
+            while n % p == 0:
+                n //= p
+                pk *= p
+            total *= (pk * p - 1) // (p - 1)
+        p += 1 if p == 2 else 2
+    if n > 1:
+        total *= n + 1
+    return total
+
 
 def sum_divisors(n):
-    sum = 0
-    x = 1
-    while x < n:
-        if n % x == 0:
-            sum += x
-        else:
-            x += 1
-            
-    return sum
+    # Sum of the proper divisors of n (every divisor except n itself)
+    if n < 1:
+        return 0
+    return sigma(n) - n
+
+
+def sigma_sieve(limit):
+    # sigma(k) for every k in [0, limit]: each d adds itself to its
+    # multiples, O(limit log limit) additions in total
+    if np is not None:
+        sig = np.zeros(limit + 1, dtype=np.int64)
+        r = isqrt(limit)
+        # Small divisors d <= r: one slice per d
+        for d in range(1, r + 1):
+            sig[d::d] += d
+        # Large divisors d > r have a small cofactor q: one slice per q
+        for q in range(1, limit // (r + 1) + 1):
+            sig[q * (r + 1)::q] += np.arange(r + 1, limit // q + 1)
+        return sig
+    sig = [0] * (limit + 1)
+    for d in range(1, limit + 1):
+        for k in range(d, limit + 1, d):
+            sig[k] += d
+    return sig
+
 
+def classify_range(a, b):
+    # Label every n in [a, b) as "perfect", "abundant", "deficient" or
+    # "amicable" (n has a partner m != n with s(n) = m and s(m) = n, where
+    # s is the proper divisor sum); amicable takes precedence
+    a = max(a, 1)
+    sig = sigma_sieve(max(b - 1, 0))
+    labels = []
+    for n in range(a, b):
+        s = int(sig[n]) - n
+        if s == n:
+            labels.append("perfect")
+            continue
+        if s > 1:
+            partner = int(sig[s]) - s if s < b else sum_divisors(s)
+            if partner == n:
+                labels.append("amicable")
+                continue
+        labels.append("abundant" if s > n else "deficient")
+    return labels
 
 
+if __name__ == "__main__":
+    print(sum_divisors(0))
+    print(sum_divisors(3))
+    print(sum_divisors(36))
+    print(sum_divisors(102))
+    for n, label in zip(range(1, 301), classify_range(1, 301)):
+        if label != "deficient":
+            print(n, label)